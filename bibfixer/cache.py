@@ -0,0 +1,155 @@
+"""Persistent bookkeeping used to skip work on files that have not changed.
+
+Every curation run used to repeat each fix stage on every file even when a
+previous run had already processed exactly the same content.  The
+:class:`StageCache` defined here remembers, per bib file, the content hash a
+stage produced last time; when the file on disk still hashes to that value
+the stage can be skipped because rerunning it would not change anything.
+
+The cache is stored as JSON under ``$BIBFIXER_CACHE_DIR`` (falling back to
+``$XDG_CACHE_HOME/bibfixer`` or ``~/.cache/bibfixer``).  Setting the
+``BIBFIXER_NO_CACHE`` environment variable disables it entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# bump whenever the on-disk layout changes so stale files are ignored
+CACHE_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """Return the directory used for bibfixer's persistent caches."""
+    override = os.environ.get("BIBFIXER_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "bibfixer"
+
+
+def cache_enabled() -> bool:
+    """Return ``False`` when the user opted out via ``BIBFIXER_NO_CACHE``."""
+    return not os.environ.get("BIBFIXER_NO_CACHE")
+
+
+def file_digest(path: Path | str) -> str | None:
+    """Return the SHA-256 of *path*'s content, or ``None`` if unreadable."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(data).hexdigest()
+
+
+class StageCache:
+    """Record of which fix stages have already seen a file's current content.
+
+    Records are keyed by absolute path and store, for every stage, the
+    ``(size, sha256)`` of the file right after the stage ran together with a
+    stage version.  The size acts as a hash-free fast path: a size mismatch
+    proves the file changed without reading it.  Modification times are
+    deliberately not trusted on their own because many filesystems only
+    record them with coarse granularity, so two same-sized writes in quick
+    succession would be indistinguishable.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path) if path is not None else cache_dir() / "stages.json"
+        self._records: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def _key(bib_file: Path | str) -> str:
+        return str(Path(bib_file).resolve())
+
+    def load(self) -> None:
+        """Read the cache file; a missing or corrupt file yields an empty cache."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            records = data.get("files")
+            if isinstance(records, dict):
+                self._records = records
+
+    def save(self) -> None:
+        """Persist the cache if anything changed.  Failures are ignored."""
+        if not self._dirty:
+            return
+        payload = {"version": CACHE_VERSION, "files": self._records}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # a private temporary file: concurrent runs sharing the cache
+            # directory would otherwise write through the same name
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:  # best-effort only; the cache is an optimisation
+            return
+        self._dirty = False
+
+    def matches(self, bib_file: Path | str, stage: str, version: str) -> bool:
+        """Return ``True`` if *stage* already processed the current content."""
+        record = self._records.get(self._key(bib_file), {}).get(stage)
+        if not record or record.get("version") != version:
+            return False
+        try:
+            size = os.stat(bib_file).st_size
+        except OSError:
+            return False
+        if size != record.get("size"):
+            return False
+        return file_digest(bib_file) == record.get("sha256")
+
+    def export(self, bib_file: Path | str) -> dict[str, Any]:
+        """Return a copy of the stage records for *bib_file*."""
+        return dict(self._records.get(self._key(bib_file), {}))
+
+    def merge(self, bib_file: Path | str, stages: dict[str, Any]) -> None:
+        """Adopt stage records exported by another process for *bib_file*."""
+        if not stages:
+            return
+        self._records.setdefault(self._key(bib_file), {}).update(stages)
+        self._dirty = True
+
+    def update(
+        self,
+        bib_file: Path | str,
+        stage: str,
+        version: str,
+        content: bytes | None = None,
+    ) -> None:
+        """Remember the file's current content as the output of *stage*.
+
+        Pass *content* when the stage's output is still in memory and has not
+        been written yet; it is recorded instead of what is on disk.
+        """
+        if content is None:
+            digest = file_digest(bib_file)
+            if digest is None:
+                return
+            size = os.stat(bib_file).st_size
+        else:
+            digest = hashlib.sha256(content).hexdigest()
+            size = len(content)
+        stages = self._records.setdefault(self._key(bib_file), {})
+        stages[stage] = {
+            "version": version,
+            "size": size,
+            "sha256": digest,
+        }
+        self._dirty = True
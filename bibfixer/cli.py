@@ -101,6 +101,7 @@ Examples:
     parser.add_argument('--yes', '-y', action='store_true', help='Skip confirmation prompt and proceed automatically')
     parser.add_argument('--preserve-keys', action='store_true', help='Do not modify citation keys (skip sanitization and consolidation)')
     parser.add_argument('--no-betterbib', action='store_true', help='Skip running betterbib even if available')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N', help='Process up to N bib files in parallel (default: 1)')
 
     args = parser.parse_args()
 
@@ -111,7 +112,7 @@ Examples:
         return 1
 
     if args.action == 'validate':
-        return validate_bibliography()
+        return validate_bibliography(jobs=args.jobs)
 
     if args.action == 'curate':
         if not args.yes:
@@ -124,6 +125,7 @@ Examples:
             create_backups=not args.no_backup,
             preserve_keys=args.preserve_keys,
             use_betterbib=use_betterbib,
+            jobs=args.jobs,
         )
         return 0
 
@@ -139,7 +141,7 @@ Examples:
     print("=" * 80)
     print("\nStep 1: Initial validation")
     print("=" * 80)
-    validate_bibliography()
+    validate_bibliography(jobs=args.jobs)
 
     print("\n\n" + "=" * 80)
     print("Step 2: Curation and cleanup")
@@ -149,12 +151,13 @@ Examples:
         create_backups=not args.no_backup,
         preserve_keys=args.preserve_keys,
         use_betterbib=use_betterbib,
+        jobs=args.jobs,
     )
 
     print("\n\n" + "=" * 80)
     print("Step 3: Final validation")
     print("=" * 80)
-    validate_bibliography()
+    validate_bibliography(jobs=args.jobs)
 
     print("\n\n" + "=" * 80)
     print("POLISHING COMPLETE")
@@ -7,9 +7,16 @@ entries, and a few constants used across the project.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Iterable, Iterator
 
 # bibtexparser (1.x) relies on pyparsing, which has undergone an API change in
 # version 3.0; names such as ``DelimitedList`` and ``add_parse_action`` were
@@ -33,10 +40,14 @@ except ImportError:
     pass
 
 import bibtexparser  # type: ignore[import]
+from bibtexparser.bibdatabase import BibDatabase  # type: ignore[import]
 from bibtexparser.bparser import BibTexParser  # type: ignore[import]
 from bibtexparser.bwriter import BibTexWriter  # type: ignore[import]
 from bibtexparser.customization import convert_to_unicode  # type: ignore[import]
 
+from . import utils
+from .cache import cache_dir, cache_enabled
+
 # constant list that was previously defined in the monolithic script
 FIELDS_TO_REMOVE = [
     "file",
@@ -55,6 +66,205 @@ FIELDS_TO_REMOVE = [
 ]
 
 
+# Parsed databases keyed by a digest of the raw file content.  Curation runs
+# parse the same files many times over (duplicate detection, DOI
+# consolidation, validation ...); keying on content rather than on path and
+# mtime means a rewrite is never missed, however coarse the filesystem's
+# timestamps, while an unchanged file costs one read and hash instead of a
+# full bibtexparser run.
+_PARSE_CACHE: OrderedDict[bytes, BibDatabase] = OrderedDict()
+_PARSE_CACHE_SIZE = 128
+
+
+def clear_parse_cache() -> None:
+    """Forget every cached parse result."""
+    _PARSE_CACHE.clear()
+
+
+def _copy_database(db: BibDatabase) -> BibDatabase:
+    """Return a copy of *db* whose entries can be mutated independently."""
+    new = BibDatabase()
+    new.entries = [dict(entry) for entry in db.entries]
+    new.comments = list(db.comments)
+    new.preambles = list(db.preambles)
+    new.strings = OrderedDict(db.strings)
+    return new
+
+
+# Parse results also persist across runs under the cache directory, keyed
+# the same way, so an unchanged bibliography is loaded rather than re-parsed
+# on every invocation.  Only plain JSON data is stored, never pickles: the
+# cache directory may be shared, and loading it must not run code.  Bump the
+# format when the parser settings below change; the bibtexparser version is
+# part of the key as well.
+_PARSE_CACHE_FORMAT = 2
+_PARSE_CACHE_MAX_FILES = 256
+
+
+def _disk_cache_path(key: bytes) -> Path:
+    return cache_dir() / "parsed" / f"{key.hex()}.json"
+
+
+def _is_str_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+def _database_from_data(data: Any) -> BibDatabase | None:
+    """Rebuild a database stored by :func:`_store_parsed`; ``None`` if invalid."""
+    if not isinstance(data, dict):
+        return None
+    entries = data.get("entries")
+    strings = data.get("strings")
+    if not (
+        isinstance(entries, list)
+        and all(
+            isinstance(entry, dict) and all(isinstance(v, str) for v in entry.values())
+            for entry in entries
+        )
+        and _is_str_list(data.get("comments"))
+        and _is_str_list(data.get("preambles"))
+        and isinstance(strings, list)
+        and all(isinstance(pair, list) and len(pair) == 2 and _is_str_list(pair) for pair in strings)
+    ):
+        return None
+    db = BibDatabase()
+    db.entries = entries
+    db.comments = data["comments"]
+    db.preambles = data["preambles"]
+    db.strings = OrderedDict(strings)
+    return db
+
+
+def _load_parsed(key: bytes) -> BibDatabase | None:
+    if not cache_enabled():
+        return None
+    try:
+        data = json.loads(_disk_cache_path(key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):  # missing, truncated or unreadable
+        return None
+    return _database_from_data(data)
+
+
+def _prune_parse_cache(directory: Path) -> None:
+    """Keep *directory* bounded by dropping the least recently written files."""
+    files = []
+    for path in directory.glob("*.json"):
+        try:
+            files.append((path.stat().st_mtime, path))
+        except FileNotFoundError:  # pruned meanwhile by another worker
+            continue
+    files.sort()
+    for _, old in files[:-_PARSE_CACHE_MAX_FILES]:
+        old.unlink(missing_ok=True)
+    # pickles written by older versions are never loaded again
+    for old in directory.glob("*.pickle"):
+        old.unlink(missing_ok=True)
+
+
+def _store_parsed(key: bytes, db: BibDatabase) -> None:
+    if not cache_enabled():
+        return
+    path = _disk_cache_path(key)
+    data = {
+        "entries": db.entries,
+        "comments": db.comments,
+        "preambles": db.preambles,
+        "strings": list(db.strings.items()),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # a private temporary file: worker processes parsing byte-identical
+        # files store under the same key at the same time
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        _prune_parse_cache(path.parent)
+    except (OSError, TypeError, ValueError):  # best-effort only, like the stage cache
+        return
+
+
+def _parse_key(raw: bytes) -> bytes:
+    hasher = hashlib.blake2b(raw, digest_size=16)
+    hasher.update(f"{_PARSE_CACHE_FORMAT}:{bibtexparser.__version__}".encode())
+    return hasher.digest()
+
+
+def _parse_bytes(raw: bytes, persist: bool = True) -> BibDatabase:
+    """Parse *raw* BibTeX, returning a private copy of the cached result.
+
+    Only file contents are worth keeping across runs; pass ``persist=False``
+    for text that exists only in memory, so that it never touches the disk.
+    """
+    key = _parse_key(raw)
+    db = _PARSE_CACHE.get(key)
+    if db is None:
+        db = _load_parsed(key) if persist else None
+        if db is None:
+            parser = BibTexParser()
+            parser.customization = convert_to_unicode
+            parser.ignore_nonstandard_types = False
+            parser.homogenise_fields = False
+            db = bibtexparser.loads(raw.decode("utf-8"), parser=parser)
+            if persist:
+                _store_parsed(key, db)
+        _PARSE_CACHE[key] = db
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    else:
+        _PARSE_CACHE.move_to_end(key)
+    return _copy_database(db)
+
+
+def atomic_write_text(path: Path | str, text: str) -> None:
+    """Replace the content of *path* with *text* in a single step.
+
+    The text goes to a temporary file next to the target, which is then
+    renamed over it, so an interrupted run never leaves a truncated file
+    behind.  Symlinks are followed, so the link survives and its target is
+    rewritten, and the target's permission bits are kept.
+    """
+    target = Path(os.path.realpath(path))
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(text)
+        try:
+            shutil.copymode(target, tmp)
+        except OSError:  # the target does not exist yet
+            pass
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def dumps_database(db: BibDatabase) -> str:
+    """Serialise *db* exactly as :meth:`BibFile.write` stores it on disk."""
+    writer = BibTexWriter()
+    writer.indent = "  "
+    writer.display_order = (
+        "title",
+        "author",
+        "journal",
+        "year",
+        "volume",
+        "number",
+        "pages",
+        "doi",
+        "url",
+        "publisher",
+    )
+    return writer.write(db)
+
+
 @dataclass
 class EntryMeta:
     """Metadata for a single BibTeX entry.
@@ -73,7 +283,9 @@ class BibFile:
     """Lightweight wrapper around a BibTeX file and its parsed database.
 
     Instances behave like a container of entries and provide convenience
-    methods for reading from and writing back to disk.
+    methods for reading from and writing back to disk.  ``bibtexparser``
+    lower-cases field names while parsing, so callers can look fields up by
+    their lower-case name (``entry.get('doi')``) without trying variants.
     """
 
     def __init__(self, path: Path | str):
@@ -82,37 +294,16 @@ class BibFile:
         self.read()
 
     def read(self) -> None:
-        parser = BibTexParser()
-        parser.customization = convert_to_unicode
-        parser.ignore_nonstandard_types = False
-        parser.homogenise_fields = False
-
         try:
-            with self.path.open("r", encoding="utf-8") as f:
-                self.database = bibtexparser.load(f, parser=parser)
+            self.database = _parse_bytes(self.path.read_bytes())
         except Exception as exc:
             raise RuntimeError(f"Error parsing {self.path}: {exc}")
 
     def write(self) -> None:
         if self.database is None:
             raise RuntimeError("database not loaded")
-        writer = BibTexWriter()
-        writer.indent = "  "
-        writer.display_order = (
-            "title",
-            "author",
-            "journal",
-            "year",
-            "volume",
-            "number",
-            "pages",
-            "doi",
-            "url",
-            "publisher",
-        )
         try:
-            with self.path.open("w", encoding="utf-8") as f:
-                bibtexparser.dump(self.database, f, writer=writer)
+            atomic_write_text(self.path, dumps_database(self.database))
         except Exception as exc:
             raise RuntimeError(f"Error writing {self.path}: {exc}")
 
@@ -121,6 +312,71 @@ class BibFile:
         return self.database.entries if self.database else []
 
 
+class BibPipeline:
+    """Run a series of fixers over one file with a single read and write.
+
+    Text fixers are ``(text) -> (new_text, count)`` callables.  Entry fixers
+    are ``(database) -> count`` callables that edit parsed entries in place.
+    The database is parsed lazily from the current text and serialised back
+    as soon as an entry fixer reports a change.  It is then re-parsed only if
+    another entry fixer needs it, because the parser's customisations can
+    read the serialised text back differently from the edited entries.
+    Nothing touches the disk until :meth:`flush`.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.text = self.path.read_text(encoding="utf-8")
+        self._saved = self.text
+        self._database: BibDatabase | None = None
+
+    @property
+    def database(self) -> BibDatabase:
+        if self._database is None:
+            self._database = parse_bibtex_string(self.text)
+        return self._database
+
+    @property
+    def changed(self) -> bool:
+        return self.text != self._saved
+
+    def apply_text_fixer(self, fixer: Callable[[str], tuple[str, int]]) -> int:
+        new_text, count = fixer(self.text)
+        if new_text != self.text:
+            self.text = new_text
+            self._database = None
+        return count
+
+    def apply_entry_fixer(
+        self,
+        fixer: Callable[[BibDatabase], int],
+        precheck: Callable[[str], bool] | None = None,
+    ) -> int:
+        """Run *fixer* on the parsed entries.
+
+        *precheck*, if given, is called on the text first; returning
+        ``False`` skips the fixer without parsing anything.
+        """
+        if precheck is not None and not precheck(self.text):
+            return 0
+        count = fixer(self.database)
+        if count:
+            self.text = dumps_database(self.database)
+            self._database = None
+        return count
+
+    def flush(self) -> bool:
+        """Write the text back if any fixer changed it; return whether it did."""
+        if not self.changed:
+            return False
+        try:
+            atomic_write_text(self.path, self.text)
+        except Exception as exc:
+            raise RuntimeError(f"Error writing {self.path}: {exc}")
+        self._saved = self.text
+        return True
+
+
 # helpers for field-level iteration and transformation
 
 
@@ -176,8 +432,170 @@ def parse_bibtex_file(path: Path | str) -> bibtexparser.bibdatabase.BibDatabase:
     return bf.database
 
 
+def parse_bibtex_string(text: str) -> bibtexparser.bibdatabase.BibDatabase:
+    """Parse BibTeX source held in memory, sharing the in-memory parse cache."""
+    return _parse_bytes(text.encode("utf-8"), persist=False)
+
+
+def _parse_for_cache(path: Path) -> tuple[bytes, BibDatabase] | None:
+    """Worker for :func:`preparse_files`: return ``(cache key, database)``."""
+    try:
+        raw = path.read_bytes()
+        db = _parse_bytes(raw)
+    except Exception:
+        # leave the error to be reported by whoever parses the file for real
+        return None
+    return _parse_key(raw), db
+
+
+def preparse_files(paths: Iterable[Path | str], jobs: int = 1) -> None:
+    """Parse *paths* in up to *jobs* worker processes to seed the parse cache.
+
+    Every later parse of an unchanged file is then a cache hit, so checks
+    that each walk all files run at the speed of the slowest single parse
+    rather than the sum of them.  With ``jobs <= 1`` this does nothing.
+    """
+    todo = [Path(p) for p in paths]
+    if jobs <= 1 or len(todo) < 2:
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+        for result in pool.map(_parse_for_cache, todo):
+            if result is None:
+                continue
+            key, db = result
+            _PARSE_CACHE[key] = db
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+
+
+# entry headers such as ``@article{key,`` (``@string``/``@comment`` are
+# filtered out afterwards) and the fields the metadata scan extracts
+_ENTRY_HEADER_RE = re.compile(r'@\s*(\w+)\s*[{(]\s*([^,\s]+)\s*,')
+_SCAN_FIELD_RES = {
+    name: re.compile(rf'(?i)(?<![\w-]){name}\s*=\s*[{{"]*\s*([^,}}"\n]+)')
+    for name in ('doi', 'year', 'month')
+}
+_NON_ENTRY_TYPES = frozenset({'comment', 'string', 'preamble'})
+
+
+def scan_bib_ids_dois(
+    path: Path | str,
+) -> list[tuple[str, str | None, str | None, str | None]]:
+    """Return ``(id, doi, year, month)`` for each entry without parsing.
+
+    This is a regex scan for metadata-only checks and is much cheaper than a
+    full :mod:`bibtexparser` parse.  It is deliberately tolerant: field
+    values are returned stripped of braces and quotes but are otherwise raw,
+    string macros are not expanded, and text inside ``@comment`` blocks is
+    skipped.  The values can therefore differ from what the parser reads;
+    :func:`scan_duplicate_candidates` does its own, stricter scan.
+    An unreadable file yields an empty list.
+    """
+    try:
+        text = Path(path).read_text(encoding='utf-8', errors='replace')
+    except OSError:
+        return []
+    headers = list(_ENTRY_HEADER_RE.finditer(text))
+    result = []
+    for i, m in enumerate(headers):
+        if m.group(1).lower() in _NON_ENTRY_TYPES:
+            continue
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        block = text[m.end():end]
+        values = []
+        for regex in _SCAN_FIELD_RES.values():
+            found = regex.search(block)
+            values.append(found.group(1).strip() if found else None)
+        result.append((m.group(2), *values))
+    return result
+
+
+# anything the parser might take for the start of an entry
+_ENTRY_START_RE = re.compile(r'@\s*([^\s@{}(),="#%]+)\s*[{(]')
+# keys and DOI values the parser's LaTeX conversion leaves as they are
+_PLAIN_KEY_RE = re.compile(r'[^\\{}()"#%]+')
+_DOI_ASSIGN_RE = re.compile(r'(?i)(?<![\w-])doi\s*=')
+_PLAIN_DOI_RE = re.compile(
+    r'(?i)(?<![\w-])doi\s*=\s*'
+    r'(?:\{\{([^{}\\"#%\n]*)\}\}|\{([^{}\\"#%\n]*)\}|"([^{}\\"#%\n]*)")'
+    r'\s*[,})]'
+)
+
+
+def _scan_keys_dois(text: str) -> tuple[list[tuple[str, str | None]], bool, bool]:
+    """Return ``(entries, keys_exact, dois_exact)`` for BibTeX *text*.
+
+    *entries* holds ``(key, doi)`` per entry.  ``keys_exact`` and
+    ``dois_exact`` are ``False`` as soon as the scan meets something it
+    cannot read exactly as the parser would: an entry header it does not
+    recognise, a key with LaTeX markup, or a ``doi`` field that is repeated,
+    mentioned inside another field, built from macros or contains markup.
+    Entries inside ``@comment`` blocks are reported too; extra entries can
+    only cause false alarms.
+    """
+    starts = list(_ENTRY_START_RE.finditer(text))
+    entries: list[tuple[str, str | None]] = []
+    keys_exact = dois_exact = True
+    for i, start in enumerate(starts):
+        if start.group(1).lower() in _NON_ENTRY_TYPES:
+            continue
+        end = starts[i + 1].start() if i + 1 < len(starts) else len(text)
+        header = _ENTRY_HEADER_RE.match(text, start.start())
+        if header is None or not _PLAIN_KEY_RE.fullmatch(header.group(2)):
+            # the parser may still find an entry here, with unknown contents
+            keys_exact = dois_exact = False
+            continue
+        block = text[header.end():end]
+        doi = None
+        assignments = len(_DOI_ASSIGN_RE.findall(block))
+        if assignments:
+            plain = _PLAIN_DOI_RE.search(block) if assignments == 1 else None
+            if plain is None:
+                dois_exact = False
+            else:
+                doi = next(g for g in plain.groups() if g is not None)
+        entries.append((header.group(2), doi))
+    return entries, keys_exact, dois_exact
+
+
+def scan_duplicate_candidates(paths: Iterable[Path | str]) -> tuple[bool, bool]:
+    """Return whether *paths* may contain duplicate keys and duplicate DOIs.
+
+    A regex scan that over-approximates: keys are compared after Unicode
+    normalisation, a DOI counts once it occurs twice whatever the keys, and
+    a file the scan cannot read exactly as the parser does (undecodable,
+    unusual headers or keys, DOIs with markup, macros or more than one
+    ``doi =`` in an entry) reports a possible duplicate.  A ``False``
+    therefore means a full parse would not find duplicates either.
+    """
+    keys: set[str | None] = set()
+    dois: set[str] = set()
+    dup_keys = dup_dois = False
+    for path in paths:
+        try:
+            text = Path(path).read_bytes().decode('utf-8')
+        except (OSError, UnicodeError):
+            # leave the verdict, and any error, to the full parse
+            return True, True
+        entries, keys_exact, dois_exact = _scan_keys_dois(text)
+        dup_keys = dup_keys or not keys_exact
+        dup_dois = dup_dois or not dois_exact
+        for key, doi in entries:
+            norm_key = utils.normalize_unicode(key.strip())
+            dup_keys = dup_keys or norm_key in keys
+            keys.add(norm_key)
+            norm_doi = utils.normalize_doi(utils.normalize_unicode(doi))
+            if norm_doi:
+                dup_dois = dup_dois or norm_doi in dois
+                dois.add(norm_doi)
+        if dup_keys and dup_dois:
+            break
+    return dup_keys, dup_dois
+
+
 def write_bib_file(path: Path | str, bib_database: bibtexparser.bibdatabase.BibDatabase) -> None:
     """Write a :class:`BibDatabase` back to disk.  Used by the legacy script."""
-    bf = BibFile(path)
-    bf.database = bib_database
-    bf.write()
+    # the old content is about to be replaced, so don't parse it first
+    atomic_write_text(path, dumps_database(bib_database))
@@ -11,16 +11,22 @@ The public API is intentionally minimal; callers usually invoke
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import subprocess
 import shutil
 import re
 import sys
 import os
+import platform
 from collections import defaultdict
+from contextlib import redirect_stdout
 from pathlib import Path
-from typing import Iterable, Any
+from typing import Any, Callable, Iterable
 
-from . import core, utils, helpers
+from . import __version__, core, fixes, utils, helpers
+from .cache import StageCache, cache_enabled
 from .core import FIELDS_TO_REMOVE
 
 # import frequently used fix routines at module level for simplicity
@@ -35,16 +41,62 @@ from .fixes import (
     fix_legacy_month_fields,
     uncomment_bibtex_entries,
 )
+from .validation import generate_report
 
 
 # ---------------------------------------------------------------------------
 # simple helpers
 # ---------------------------------------------------------------------------
 
+# ``fcntl.FICLONE`` (Linux only) exists on Python 3.12+.  Older versions fall
+# back to 0x40049409, the ``_IOW(0x94, 9, int)`` value in the asm-generic
+# encoding shared by x86, arm and the other machines listed here; alpha, mips,
+# powerpc, sparc and parisc encode ioctls differently and get no fallback.
+_FICLONE = 0x40049409
+_FICLONE_MACHINES = ('x86_64', 'amd64', 'i386', 'i686', 'aarch64', 'arm64', 'riscv64', 's390x')
+
+
+def _ficlone_request(fcntl: Any) -> int | None:
+    """Return the ``FICLONE`` ioctl request for this platform, if known."""
+    request = getattr(fcntl, 'FICLONE', None)
+    if request is not None:
+        return request
+    machine = platform.machine().lower()
+    if sys.platform.startswith('linux') and (machine in _FICLONE_MACHINES or machine.startswith('arm')):
+        return _FICLONE
+    return None
+
+
+def _make_snapshot_backup(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst*, sharing data blocks when the filesystem can.
+
+    On copy-on-write filesystems (Btrfs, XFS, bcachefs) a ``FICLONE`` reflink
+    makes the backup O(1) regardless of file size while still being an
+    independent file.  Everywhere else, or if the ioctl fails, a regular
+    :func:`shutil.copy2` is used.  Hard links are deliberately not used: the
+    external tools may rewrite the original in place, which would silently
+    modify a hard-linked "backup" as well.
+    """
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        fcntl = None
+    request = _ficlone_request(fcntl) if fcntl is not None else None
+    if request is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), request, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 def create_backup(bib_file: Path) -> Path:
     """Copy *bib_file* to ``.bib.backup`` and return the new path."""
     backup_path = bib_file.with_suffix('.bib.backup')
-    shutil.copy2(bib_file, backup_path)
+    _make_snapshot_backup(bib_file, backup_path)
     print(f"  Created backup: {backup_path}")
     return backup_path
 
@@ -68,23 +120,29 @@ def update_with_betterbib(bib_file: Path) -> None:
     # return an empty database instead.  We check the raw text for an entry
     # marker and then make sure the parsed result isn’t empty; if it is we
     # assume the file is hopeless and skip the helper.
-    text = bib_file.read_text(encoding="utf-8", errors="ignore")
+    # the marker test only needs the raw bytes; decoding is left to the parser
+    raw = bib_file.read_bytes()
     parsed = core.parse_bibtex_file(bib_file)
-    if "@" in text and (not parsed or not getattr(parsed, "entries", [])):
+    if b"@" in raw and (not parsed or not getattr(parsed, "entries", [])):
         print("  Warning: input file looks unparsable, skipping betterbib update")
         return
+    if not parsed or not parsed.entries:
+        # only comments or macros: there is nothing to look up online
+        print("  No entries to update, skipping betterbib update")
+        return
 
     backup_path = bib_file.with_suffix('.bib.betterbib_backup')
-    shutil.copy2(bib_file, backup_path)
+    _make_snapshot_backup(bib_file, backup_path)
 
-    # capture prior DOI state so we can spot obvious corruption later
-    before_db = core.parse_bibtex_file(bib_file)
+    # capture prior DOI state so we can spot obvious corruption later; the
+    # file has not changed since it was parsed above
+    before_db = parsed
     dois_before = {}
     if before_db:
         for e in before_db.entries:
             key = e.get('ID', '')
             if key:
-                doi = e.get('doi') or e.get('DOI')
+                doi = e.get('doi')
                 if doi:
                     dois_before[key] = utils.normalize_doi(doi)
 
@@ -151,7 +209,7 @@ def update_with_betterbib(bib_file: Path) -> None:
         for e in after_db.entries:
             k = e.get('ID', '')
             if k in dois_before:
-                doi_after = utils.normalize_doi(e.get('doi') or e.get('DOI'))
+                doi_after = utils.normalize_doi(e.get('doi'))
                 if dois_before[k] and doi_after and dois_before[k] != doi_after:
                     print(f"  Suspicious metadata change detected for {k}")
                     print(f"  Warning: betterbib changed DOI for {k} ({dois_before[k]} → {doi_after}), restoring")
@@ -181,6 +239,12 @@ def abbreviate_with_betterbib(bib_file: Path) -> None:
     the latter still runs later as a fallback.
     """
     print("  Abbreviating journal names with betterbib...")
+    # the tool only rewrites journal fields, so spare the process start-up
+    # when there are none
+    db = core.parse_bibtex_file(bib_file)
+    if not db or not any(e.get('journal') for e in db.entries):
+        print("  No journal names to abbreviate, skipping")
+        return
     # import directly like :func:`update_with_betterbib`; failures are
     # unexpected because the package is required, but we retain a friendly
     # warning rather than letting an ImportError bubble up.
@@ -219,51 +283,104 @@ def abbreviate_with_betterbib(bib_file: Path) -> None:
     print("  betterbib journal abbreviation completed")
 
 
-def format_with_bibfmt(bib_file: Path) -> None:
+# bibfmt options shared by every invocation; the input files are appended
+_BIBFMT_BASE_CMD = (
+    'bibfmt', '-i', '--indent', '2', '--align', '14', '-d', 'braces',
+    *(arg for field in FIELDS_TO_REMOVE for arg in ('--drop', field)),
+)
+
+
+def _bibfmt_version() -> str:
+    """Return the stage-cache version of a ``bibfmt`` pass.
+
+    The output depends on the installed ``bibfmt`` and on the options it is
+    run with, so both are covered.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        tool = version('bibfmt')
+    except PackageNotFoundError:
+        tool = 'unknown'
+    options = json.dumps(_BIBFMT_BASE_CMD)
+    return f"{tool}:{hashlib.sha1(options.encode('utf-8')).hexdigest()[:12]}"
+
+
+def format_with_bibfmt(
+    bib_files: Path | Iterable[Path],
+    stage_cache: StageCache | None = None,
+) -> None:
     """Call ``bibfmt`` to format and drop unwanted fields.
 
     The function is intentionally simple: we build the command-line once,
     invoke it and ignore most errors.  ``bibfmt`` is already robust and
-    the surrounding workflow has further sanity checks.
+    the surrounding workflow has further sanity checks.  *bib_files* may be a
+    single path or several; a batch is formatted by one ``bibfmt`` process
+    so the interpreter start-up is paid only once.  With *stage_cache*,
+    files still holding the content ``bibfmt`` last produced are left out,
+    and no process is started if that covers all of them.
     """
+    paths = [bib_files] if isinstance(bib_files, Path) else list(bib_files)
+    if not paths:
+        return
     print("  Formatting with bibfmt and removing non-standard fields...")
-
-    cmd = ['bibfmt', '-i', '--indent', '2', '--align', '14', '-d', 'braces']
-    for field in FIELDS_TO_REMOVE:
-        cmd += ['--drop', field]
-    cmd.append(str(bib_file))
-
-    # keep both the raw text and the parsed database so we can
-    # intelligently detect title/DOI changes later.
-    try:
-        before = bib_file.read_text(encoding='utf-8')
-    except Exception:
-        before = None
-    try:
-        before_db = core.parse_bibtex_file(bib_file)
-    except Exception:
-        before_db = None
+    version = ''
+    if stage_cache is not None:
+        version = _bibfmt_version()
+        paths = [p for p in paths if not stage_cache.matches(p, 'bibfmt', version)]
+        if not paths:
+            print("  Already formatted, skipping bibfmt")
+            return
+
+    cmd = [*_BIBFMT_BASE_CMD, *(str(p) for p in paths)]
+
+    # keep the raw text so we can intelligently detect title/DOI changes
+    # later; it is only parsed if bibfmt actually changed the file.
+    befores: list[str | None] = []
+    for bib_file in paths:
+        try:
+            befores.append(bib_file.read_text(encoding='utf-8'))
+        except Exception:
+            befores.append(None)
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60 * len(paths))
     except Exception as exc:  # pragma: no cover
         print(f"  Warning: bibfmt failed: {exc}")
         return
 
-    if result.returncode != 0:
+    failed = result.returncode != 0
+    if failed:
         msg = result.stderr.strip() or result.stdout.strip() or f"return code {result.returncode}"
         print(f"  Warning: bibfmt had issues: {msg}")
-        return
     else:
         print("  bibfmt formatting completed")
 
-    # parse the after state so we can look for actual field-level changes
+    # a failing batch may still have rewritten some files in place, so every
+    # file keeps its sanity check; only a clean run is remembered as done
+    for bib_file, before in zip(paths, befores):
+        _check_bibfmt_changes(bib_file, before)
+        if stage_cache is not None and not failed:
+            stage_cache.update(bib_file, 'bibfmt', version)
+
+
+def _check_bibfmt_changes(bib_file: Path, before: str | None) -> None:
+    """Warn if bibfmt altered titles or DOIs in *bib_file*."""
     try:
         after = bib_file.read_text(encoding='utf-8')
     except Exception:
         after = None
+    if before is not None and after == before:
+        # nothing was reformatted, so no metadata can have changed
+        return
+
+    # parse both states so we can look for actual field-level changes
+    try:
+        before_db = core.parse_bibtex_string(before) if before is not None else None
+    except Exception:
+        before_db = None
     try:
-        after_db = core.parse_bibtex_file(bib_file)
+        after_db = core.parse_bibtex_string(after) if after is not None else None
     except Exception:
         after_db = None
 
@@ -274,12 +391,15 @@ def format_with_bibfmt(bib_file: Path) -> None:
         for entry in after_db.entries:
             key = entry.get('ID', '')
             orig = before_lookup.get(key)
-            if not orig:
+            if not orig or orig == entry:
+                # untouched entries cannot have changed title or DOI
                 continue
-            if orig.get('title') and entry.get('title') and orig.get('title') != entry.get('title'):
+            title_before = orig.get('title')
+            title_after = entry.get('title')
+            if title_before and title_after and not utils.titles_similar(title_before, title_after):
                 changed_titles = True
-            doi_before = utils.normalize_doi(orig.get('doi') or orig.get('DOI') or orig.get('Doi'))
-            doi_after = utils.normalize_doi(entry.get('doi') or entry.get('DOI') or entry.get('Doi'))
+            doi_before = utils.normalize_doi(orig.get('doi'))
+            doi_after = utils.normalize_doi(entry.get('doi'))
             if doi_before and doi_after and doi_before != doi_after:
                 changed_dois = True
         if changed_titles:
@@ -296,9 +416,16 @@ def format_with_bibfmt(bib_file: Path) -> None:
 # duplicate/DOI key logic
 # ---------------------------------------------------------------------------
 
-def find_duplicates(bib_files: Iterable[Path]) -> dict[str, list[tuple[Path, dict]]]:
-    """Return a mapping key -> list of (file, entry) for duplicated keys."""
-    entries: dict[str, list[tuple[Path, dict]]] = defaultdict(list)
+def _build_entry_indexes(
+    bib_files: Iterable[Path],
+) -> tuple[dict[str, list[tuple[Path, dict]]], dict[str, list[dict]]]:
+    """Index every entry by citation key and by normalised DOI in one pass.
+
+    Returns ``(by_key, by_doi)``; :func:`find_duplicates` and
+    :func:`find_duplicate_dois` are filters over these two mappings.
+    """
+    by_key: dict[str, list[tuple[Path, dict]]] = defaultdict(list)
+    by_doi: dict[str, list[dict]] = defaultdict(list)
     for bib in bib_files:
         db = core.parse_bibtex_file(bib)
         if not db:
@@ -306,8 +433,38 @@ def find_duplicates(bib_files: Iterable[Path]) -> dict[str, list[tuple[Path, dic
         for entry in db.entries:
             key = entry.get('ID', '')
             if key:
-                entries[key].append((bib, entry))
-    return {k: v for k, v in entries.items() if len(v) > 1}
+                by_key[key].append((bib, entry))
+            norm = utils.normalize_doi(entry.get('doi'))
+            if norm:
+                by_doi[norm].append(
+                    {'key': utils.normalize_unicode(key), 'file': bib, 'entry': entry}
+                )
+    return by_key, by_doi
+
+
+def _duplicate_keys(by_key: dict[str, list[tuple[Path, dict]]]) -> dict[str, list[tuple[Path, dict]]]:
+    return {k: v for k, v in by_key.items() if len(v) > 1}
+
+
+def _duplicate_dois(by_doi: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    # a group qualifies as soon as one key differs from the first; singleton
+    # groups (the vast majority) are rejected without building anything
+    return {
+        d: lst for d, lst in by_doi.items()
+        if any(e['key'] != lst[0]['key'] for e in lst[1:])
+    }
+
+
+def find_duplicates(bib_files: Iterable[Path]) -> dict[str, list[tuple[Path, dict]]]:
+    """Return a mapping key -> list of (file, entry) for duplicated keys."""
+    bib_files = list(bib_files)
+    if not core.scan_duplicate_candidates(bib_files)[0]:
+        return {}
+    return _duplicate_keys(_build_entry_indexes(bib_files)[0])
+
+
+# fields whose presence makes a duplicate the preferred copy
+_IMPORTANT_FIELDS = ('title', 'author', 'year', 'journal', 'doi', 'pages', 'volume')
 
 
 def choose_best_entry(entries: list[tuple[Path, dict]]) -> dict:
@@ -318,12 +475,17 @@ def choose_best_entry(entries: list[tuple[Path, dict]]) -> dict:
     this logic and the tests depend on its behaviour so we keep it verbatim.
     """
     def score(entry: dict) -> float:
-        important = ['title', 'author', 'year', 'journal', 'doi', 'pages', 'volume']
         # start with a float so that later additions preserve a float type
-        s: float = sum(1 for f in important if entry.get(f))
+        s: float = sum(1 for f in _IMPORTANT_FIELDS if entry.get(f))
         s += 0.1 * len(entry)
         return s
 
+    if len(entries) == 1:
+        return entries[0][1]
+    if len(entries) == 2:
+        # the common pair case; ties keep the first entry just like max()
+        first, second = entries[0][1], entries[1][1]
+        return second if score(second) > score(first) else first
     return max((e for _, e in entries), key=score)
 
 
@@ -351,18 +513,28 @@ def synchronize_duplicates(bib_files: Iterable[Path], duplicates: dict) -> None:
 
 def find_duplicate_dois(bib_files: Iterable[Path]) -> dict[str, list[dict]]:
     """Return mapping DOI -> list of metadata dicts for keys sharing the DOI."""
-    doi_map: dict[str, list[dict]] = defaultdict(list)
-    for bib in bib_files:
-        db = core.parse_bibtex_file(bib)
-        if not db:
-            continue
-        for entry in db.entries:
-            key = utils.normalize_unicode(entry.get('ID', ''))
-            doi = entry.get('doi') or entry.get('DOI') or entry.get('Doi')
-            norm = utils.normalize_doi(doi)
-            if norm:
-                doi_map[norm].append({'key': key, 'file': bib, 'entry': entry})
-    return {d: lst for d, lst in doi_map.items() if len({e['key'] for e in lst}) > 1}
+    bib_files = list(bib_files)
+    if not core.scan_duplicate_candidates(bib_files)[1]:
+        return {}
+    return _duplicate_dois(_build_entry_indexes(bib_files)[1])
+
+
+# citation keys shaped like ``Name2020...`` are preferred when merging
+_AUTHOR_YEAR_RE = re.compile(r'^[A-Z][a-z]+\d{4}')
+
+
+def _key_score(k: str) -> float:
+    """Score used by :func:`choose_best_key`; higher is better."""
+    text = str(k)
+    s = 0.0
+    if k and text[0].isupper():
+        s += 10
+    if _AUTHOR_YEAR_RE.match(text):
+        s += 20
+    if '_' not in text:
+        s += 5
+    s -= 0.1 * len(text)
+    return s
 
 
 def choose_best_key(entries_list: list[dict]) -> str:
@@ -373,19 +545,9 @@ def choose_best_key(entries_list: list[dict]) -> str:
     small penalty for length.  The scoring logic is intentionally localised
     here to keep the public API minimal.
     """
-    def score(k: str) -> float:
-        s = 0.0
-        if k and k[0].isupper():
-            s += 10
-        if re.match(r'^[A-Z][a-z]+\d{4}', str(k)):
-            s += 20
-        if '_' not in str(k):
-            s += 5
-        s -= 0.1 * len(str(k))
-        return s
-
-    keys = list({e['key'] for e in entries_list})
-    return max(keys, key=score)
+    # dict.fromkeys de-duplicates in first-seen order, so ties go to the
+    # earliest key instead of depending on set (hash) ordering
+    return max(dict.fromkeys(e['key'] for e in entries_list), key=_key_score)
 
 
 def consolidate_duplicate_dois(bib_files: Iterable[Path], duplicates: dict) -> dict[str, str]:
@@ -397,6 +559,8 @@ def consolidate_duplicate_dois(bib_files: Iterable[Path], duplicates: dict) -> d
     if not duplicates:
         return mapping
     dbs = {bib: core.parse_bibtex_file(bib) for bib in bib_files}
+    # per file: surviving key -> merged entry that replaces it
+    replacements: dict[Path, dict[str, dict]] = defaultdict(dict)
     for doi, entries in duplicates.items():
         best_key = choose_best_key(entries)
         best_entry = choose_best_entry([(e['file'], e['entry']) for e in entries])
@@ -406,22 +570,29 @@ def consolidate_duplicate_dois(bib_files: Iterable[Path], duplicates: dict) -> d
             old = info['key']
             if old != best_key:
                 mapping[old] = best_key
-        for bib in {info['file'] for info in entries}:
-            db = dbs.get(bib)
-            if not db:
-                continue
-            # remove or replace old entries
-            to_del = []
-            for idx, ent in enumerate(db.entries):
-                k = utils.normalize_unicode(ent.get('ID', ''))
-                if k != best_key and k in mapping:
-                    to_del.append(idx)
-                elif k == best_key:
-                    db.entries[idx] = best_entry.copy()
-            for idx in reversed(to_del):
-                del db.entries[idx]
-    for bib, db in dbs.items():
-        if db:
+            replacements[info['file']][best_key] = best_entry
+    # rewrite each touched file in a single pass once every group is known,
+    # instead of rescanning (and deleting from) its entry list per DOI; a
+    # group whose copies already share the best key and content leaves its
+    # files untouched, so only files that really changed are written
+    for bib, best_by_key in replacements.items():
+        db = dbs.get(bib)
+        if not db:
+            continue
+        kept = []
+        dirty = False
+        for ent in db.entries:
+            k = utils.normalize_unicode(ent.get('ID', ''))
+            if k in best_by_key:
+                best = best_by_key[k]
+                dirty = dirty or ent != best
+                kept.append(best.copy())
+            elif k not in mapping:
+                kept.append(ent)
+            else:
+                dirty = True
+        if dirty:
+            db.entries = kept
             core.write_bib_file(bib, db)
     print(f"  Consolidated {len(duplicates)} DOIs, created {len(mapping)} key mappings")
     return mapping
@@ -433,29 +604,70 @@ def consolidate_duplicate_dois(bib_files: Iterable[Path], duplicates: dict) -> d
 
 
 
-def _apply_basic_fixes(bib_file: Path) -> None:
-    """Run the standard collection of small fix routines on *bib_file*."""
-    fix_invalid_utf8_bytes(bib_file)
-    fix_html_entities(bib_file)
-    fix_malformed_author_fields(bib_file)
-    remove_accents_from_names(bib_file)
-    fix_problematic_unicode(bib_file)
-    # abbreviate journal titles before other formatting; the mapping is
-    # intentionally small but ensures the feature is exercised by tests.
-    from .fixes import abbreviate_journal_names
-    abbreviate_journal_names(bib_file)
-    # we previously wrapped the Path in a BibFile here; the fix
-    # function now expects a Path directly.
-    fix_unescaped_percent(bib_file)
-    # legacy date fixes run at end
-    fix_legacy_year_fields(bib_file)
-    fix_legacy_month_fields(bib_file)
+def _basic_fixes_version() -> str:
+    """Return the stage-cache version of the basic fix pass.
+
+    Besides the package version this covers the journal abbreviation
+    mapping, which callers may extend at runtime; ``iso4`` is assumed to be
+    deterministic for a given installation.
+    """
+    mapping = json.dumps(sorted(fixes.JOURNAL_ABBREVIATIONS.items()))
+    return f"{__version__}:{hashlib.sha1(mapping.encode('utf-8')).hexdigest()[:12]}"
+
+
+def _apply_basic_fixes(
+    bib_file: Path,
+    stage_cache: StageCache | None = None,
+    uncomment: bool = False,
+) -> None:
+    """Run the standard collection of small fix routines on *bib_file*.
+
+    The fixers share a single read, parse and write through
+    :class:`core.BibPipeline`.  When *stage_cache* is given and the file
+    still matches what this pass produced last time, the pass is skipped.
+    With *uncomment* the recovery of commented-out entries runs afterwards
+    in the same pipeline, so the file is still written only once.  Files
+    that cannot be loaded as UTF-8 text fall back to the file-based fixers,
+    whose byte-level repair can cope with them.
+    """
+    version = _basic_fixes_version()
+    cached = stage_cache is not None and stage_cache.matches(bib_file, 'basic_fixes', version)
+    if cached and not uncomment:
+        return
+    try:
+        pipeline = core.BibPipeline(bib_file)
+    except (OSError, UnicodeDecodeError):
+        if not cached:
+            fix_invalid_utf8_bytes(bib_file)
+            fix_html_entities(bib_file)
+            fix_malformed_author_fields(bib_file)
+            remove_accents_from_names(bib_file)
+            fix_problematic_unicode(bib_file)
+            fixes.abbreviate_journal_names(bib_file)
+            fix_unescaped_percent(bib_file)
+            fix_legacy_year_fields(bib_file)
+            fix_legacy_month_fields(bib_file)
+            if stage_cache is not None:
+                stage_cache.update(bib_file, 'basic_fixes', version)
+        if uncomment:
+            uncomment_bibtex_entries(bib_file)
+        return
+    if not cached:
+        fixes.run_basic_fixes(pipeline)
+        if stage_cache is not None:
+            stage_cache.update(
+                bib_file, 'basic_fixes', version, content=pipeline.text.encode('utf-8')
+            )
+    if uncomment:
+        fixes.recover_commented_entries(pipeline)
+    pipeline.flush()
 
 
 def process_bib_file(
     bib_file: Path,
     create_backups: bool = True,
     use_betterbib: bool = True,
+    stage_cache: StageCache | None = None,
 ) -> None:
     """Apply the standard series of fixes and formatting operations to one file.
 
@@ -463,7 +675,23 @@ def process_bib_file(
     and the journal abbreviation steps.  This is useful when the optional
     helper is unavailable or known to be broken (for example on minimal
     installations or when the binary resides in the source tree).
+
+    *stage_cache* is forwarded to :func:`_apply_basic_fixes` and
+    :func:`format_with_bibfmt` so that stages which already processed the
+    current content are skipped.
     """
+    _prepare_bib_file(bib_file, create_backups, use_betterbib, stage_cache)
+    format_with_bibfmt(bib_file, stage_cache)
+    _recover_after_bibfmt(bib_file)
+
+
+def _prepare_bib_file(
+    bib_file: Path,
+    create_backups: bool = True,
+    use_betterbib: bool = True,
+    stage_cache: StageCache | None = None,
+) -> None:
+    """The part of :func:`process_bib_file` that runs before ``bibfmt``."""
     print(f"\nProcessing {bib_file.name}...")
     if create_backups:
         create_backup(bib_file)
@@ -473,21 +701,27 @@ def process_bib_file(
     else:
         print("  Skipping betterbib steps")
     print("  Fixing invalid UTF-8 byte sequences...")
-    _apply_basic_fixes(bib_file)
-    format_with_bibfmt(bib_file)
+    _apply_basic_fixes(bib_file, stage_cache)
+
+
+def _recover_after_bibfmt(bib_file: Path, stage_cache: StageCache | None = None) -> None:
+    """The part of :func:`process_bib_file` that runs after ``bibfmt``.
+
+    *stage_cache* is unused: uncommenting is a cheap text scan that is not
+    worth caching, and the parameter only exists because
+    :func:`_for_each_file` passes it to every per-file pass.
+    """
     print("  Checking for commented entries...")
-    from .fixes import uncomment_bibtex_entries
     uncomment_bibtex_entries(bib_file)
     print(f"  Completed processing {bib_file.name}")
 
 
-
-
 def consolidate_duplicate_titles(bib_files: Iterable[Path]) -> dict[str, str]:
     """Find title duplicates and return mapping old_key -> new_key."""
     title_map: dict[str, list[tuple[Path, dict]]] = defaultdict(list)
-    for bib in bib_files:
-        db = core.parse_bibtex_file(bib)
+    # parsed once: the same databases are edited and written back below
+    dbs = {bib: core.parse_bibtex_file(bib) for bib in bib_files}
+    for bib, db in dbs.items():
         if not db:
             continue
         for entry in db.entries:
@@ -500,7 +734,17 @@ def consolidate_duplicate_titles(bib_files: Iterable[Path]) -> dict[str, str]:
     if not duplicates:
         print("  No duplicate titles to consolidate.")
         return {}
-    dbs = {bib: core.parse_bibtex_file(bib) for bib in bib_files}
+    # per file: normalised ID -> positions of the entries carrying it, so
+    # each lookup is a dict access; deletions are collected and applied in
+    # one pass at the end so the positions stay valid
+    positions: dict[Path, dict[str | None, list[int]]] = {}
+    for bib, db in dbs.items():
+        if db:
+            index: dict[str | None, list[int]] = defaultdict(list)
+            for i, e in enumerate(db.entries):
+                index[utils.normalize_unicode(e.get('ID', ''))].append(i)
+            positions[bib] = index
+    dropped: dict[Path, set[int]] = defaultdict(set)
     for norm, entries in duplicates.items():
         best = choose_best_entry(entries)
         best_key = best['ID']
@@ -516,18 +760,18 @@ def consolidate_duplicate_titles(bib_files: Iterable[Path]) -> dict[str, str]:
             if not db:
                 continue
             k = utils.normalize_unicode(ent.get('ID', ''))
-            if k == best_key and bib not in keymap.values():
+            found = positions[bib].get(k)
+            if not found:
+                continue
+            if k == best_key:
                 # ensure content matches best entry
-                for idx,e in enumerate(db.entries):
-                    if utils.normalize_unicode(e.get('ID','')) == best_key:
-                        db.entries[idx] = best.copy()
-                        db.entries[idx]['ID'] = best_key
-                        break
+                db.entries[found[0]] = best.copy()
+                db.entries[found[0]]['ID'] = best_key
             elif k != best_key:
-                for idx,e in enumerate(db.entries):
-                    if utils.normalize_unicode(e.get('ID','')) == k:
-                        del db.entries[idx]
-                        break
+                dropped[bib].add(found.pop(0))
+    for bib, drop in dropped.items():
+        db = dbs[bib]
+        db.entries = [e for i, e in enumerate(db.entries) if i not in drop]
     for bib, db in dbs.items():
         if db:
             core.write_bib_file(bib, db)
@@ -548,18 +792,21 @@ def remove_duplicate_entries_across_files(bib_files: Iterable[Path]) -> int:
                 if key:
                     key_map[key].append(bib)
     removed = 0
+    # keys to drop per file, applied with one rebuild of each entry list
+    drop: dict[Path, set[str]] = defaultdict(set)
     for key, files in key_map.items():
         if len(files) < 2:
             continue
         files_sorted = sorted(files, key=lambda p: p.name)
         keeper = files_sorted[0]
         for other in files_sorted[1:]:
-            db = dbs[other]
-            entries_to_remove = [i for i,e in enumerate(db.entries) if e.get('ID','') == key]
-            for idx in reversed(entries_to_remove):
-                del db.entries[idx]
-                removed += 1
+            drop[other].add(key)
         print(f"    {key}: kept in {keeper.name}, removed from {len(files)-1} file(s)")
+    for bib, keys in drop.items():
+        db = dbs[bib]
+        before = len(db.entries)
+        db.entries = [e for e in db.entries if e.get('ID', '') not in keys]
+        removed += before - len(db.entries)
     for bib, db in dbs.items():
         if any(k in key_map and bib in key_map[k] for k in key_map):
             core.write_bib_file(bib, db)
@@ -568,45 +815,111 @@ def remove_duplicate_entries_across_files(bib_files: Iterable[Path]) -> int:
     return removed
 
 
-def remove_unused_entries(bib_files: Iterable[Path]) -> int:
-    """Delete entries that are not cited anywhere (crossrefs are preserved)."""
-    tex_files = helpers.collect_all_tex_files()
+def remove_unused_entries(
+    bib_files: Iterable[Path],
+    tex_files: Iterable[Path] | None = None,
+) -> int:
+    """Delete entries that are not cited anywhere (crossrefs are preserved).
+
+    *tex_files* defaults to :func:`helpers.collect_all_tex_files`.
+    """
+    if tex_files is None:
+        tex_files = helpers.collect_all_tex_files()
     cited = set()
     for tex in tex_files:
         cited.update(helpers.extract_citations_from_tex(tex))
     cross = set()
-    for bib in bib_files:
-        db = core.parse_bibtex_file(bib)
+    dbs = {bib: core.parse_bibtex_file(bib) for bib in bib_files}
+    for db in dbs.values():
         if not db:
             continue
         for entry in db.entries:
-            cr = entry.get('crossref') or entry.get('Crossref')
+            cr = entry.get('crossref')
             if cr:
                 norm = utils.normalize_unicode(cr)
                 if norm:
                     cross.add(norm)
     cited |= cross
     removed = 0
-    for bib in bib_files:
-        db = core.parse_bibtex_file(bib)
+    for bib, db in dbs.items():
         if not db:
             continue
-        to_drop = [i for i,e in enumerate(db.entries) if utils.normalize_unicode(e.get('ID','')) not in cited]
-        for idx in reversed(to_drop):
-            del db.entries[idx]
-            removed += 1
-        if to_drop:
+        before = len(db.entries)
+        db.entries = [e for e in db.entries if utils.normalize_unicode(e.get('ID', '')) in cited]
+        dropped = before - len(db.entries)
+        removed += dropped
+        if dropped:
             core.write_bib_file(bib, db)
-            print(f"  {bib.name}: removed {len(to_drop)} unused entries")
+            print(f"  {bib.name}: removed {dropped} unused entries")
     print(f"  Total unused entries removed: {removed}")
     return removed
 
 
+def _finish_bib_file(bib_file: Path, stage_cache: StageCache | None = None) -> None:
+    """Final per-file pass: basic fixes and recovery of commented entries."""
+    _apply_basic_fixes(bib_file, stage_cache, uncomment=True)
+    print(f"  ✓ {bib_file.name}: All fixes applied")
+
+
+def _run_captured(
+    func: Callable[..., None],
+    bib_file: Path,
+    use_cache: bool,
+    kwargs: dict[str, Any],
+) -> tuple[str, dict[str, Any]]:
+    """Worker entry point: run *func* on *bib_file* and capture its output.
+
+    The worker opens its own view of the stage cache and hands back the
+    records it wrote so the parent can merge them.
+    """
+    stage_cache = StageCache() if use_cache else None
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        func(bib_file, stage_cache=stage_cache, **kwargs)
+    return buf.getvalue(), stage_cache.export(bib_file) if stage_cache is not None else {}
+
+
+def _for_each_file(
+    func: Callable[..., None],
+    bib_files: list[Path],
+    jobs: int,
+    stage_cache: StageCache | None,
+    **kwargs: Any,
+) -> None:
+    """Call ``func(bib, stage_cache=..., **kwargs)`` for every file.
+
+    With ``jobs > 1`` the files are processed by a pool of worker processes.
+    Each worker's output is captured and printed in file order once it
+    finishes, so the log reads the same as a serial run.
+    """
+    if jobs <= 1 or len(bib_files) < 2:
+        for bib in bib_files:
+            func(bib, stage_cache=stage_cache, **kwargs)
+        return
+    if stage_cache is not None:
+        # let the workers see everything recorded so far
+        stage_cache.save()
+    # only needed for parallel runs; loading it costs noticeable start-up
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(bib_files))) as pool:
+        futures = [
+            pool.submit(_run_captured, func, bib, stage_cache is not None, kwargs)
+            for bib in bib_files
+        ]
+        for bib, future in zip(bib_files, futures):
+            output, stages = future.result()
+            print(output, end='')
+            if stage_cache is not None:
+                stage_cache.merge(bib, stages)
+
+
 def curate_bibliography(
     bib_files: Iterable[Path],
     create_backups: bool = True,
     preserve_keys: bool = False,
     use_betterbib: bool = True,
+    jobs: int = 1,
 ) -> None:
     # honour environment variable override for convenience in CI or
     # minimal installs
@@ -615,7 +928,10 @@ def curate_bibliography(
     """Run the full curation workflow on a list of files.
 
     See :mod:`bibfixer.cli` for the original documentation and steps.
+    *jobs* sets how many worker processes run the per-file stages; the
+    cross-file steps (key updates, duplicate handling) always run serially.
     """
+    bib_files = list(bib_files)
     print("=" * 70)
     print("BibTeX Curation")
     print("=" * 70)
@@ -624,56 +940,72 @@ def curate_bibliography(
     # optionally collect statistics (not currently used)
     # (previous implementation stashed _before here; it was never used.)
 
-    # process each file individually
-    for bib in bib_files:
-        process_bib_file(
-            bib,
-            create_backups=create_backups,
-            use_betterbib=use_betterbib,
-        )
+    # remembers which fix stages already saw each file's content so that a
+    # rerun on an unchanged bibliography skips them
+    stage_cache = StageCache() if cache_enabled() else None
+
+    # process each file individually; the bibfmt step in the middle of
+    # process_bib_file is run once for the whole batch so its start-up cost
+    # is paid once rather than per file
+    _for_each_file(
+        _prepare_bib_file,
+        bib_files,
+        jobs,
+        stage_cache,
+        create_backups=create_backups,
+        use_betterbib=use_betterbib,
+    )
+    format_with_bibfmt(bib_files, stage_cache)
+    _for_each_file(_recover_after_bibfmt, bib_files, jobs, stage_cache)
+
+    # the set of .tex files does not change during curation; look it up once
+    texs = helpers.collect_all_tex_files()
 
     # key sanitization and updates are handled by helpers directly
     if not preserve_keys:
         all_mappings: dict[str, str] = {}
-        for bib in bib_files:
-            all_mappings.update(helpers.sanitize_citation_keys(bib))
-        texs = helpers.collect_all_tex_files()
-        if any(t.name == 'main.tex' for t in texs):
+        standardize = any(t.name == 'main.tex' for t in texs)
+        if standardize:
             print("\nKey standardization will run (main.tex present)")
-            for bib in bib_files:
-                all_mappings.update(helpers.standardize_citation_keys(bib))
         else:
             print("\nSkipping citation key standardization (no main.tex found)")
+        for bib in bib_files:
+            all_mappings.update(helpers.fix_citation_keys(bib, standardize))
         if all_mappings:
             helpers.update_tex_citations(texs, all_mappings)
 
     # remove unused entries
-    remove_unused_entries(bib_files)
+    remove_unused_entries(bib_files, texs)
 
     # deduplicate and sync remaining entries
-    dup = find_duplicates(bib_files)
+    # a cheap scan rules out the common no-duplicates case without parsing
+    if any(core.scan_duplicate_candidates(bib_files)):
+        by_key, by_doi = _build_entry_indexes(bib_files)
+    else:
+        by_key, by_doi = {}, {}
+    dup = _duplicate_keys(by_key)
     synchronize_duplicates(bib_files, dup)
 
     if not preserve_keys:
-        doi_dup = find_duplicate_dois(bib_files)
+        # synchronising rewrites entries, so the DOI index is only still
+        # valid when there was nothing to synchronise
+        doi_dup = _duplicate_dois(by_doi) if not dup else find_duplicate_dois(bib_files)
         doi_map = consolidate_duplicate_dois(bib_files, doi_dup)
         if doi_map:
-            helpers.update_tex_citations(helpers.collect_all_tex_files(), doi_map)
+            helpers.update_tex_citations(texs, doi_map)
         title_map = consolidate_duplicate_titles(bib_files)
         if title_map:
-            helpers.update_tex_citations(helpers.collect_all_tex_files(), title_map)
+            helpers.update_tex_citations(texs, title_map)
 
     # final formatting and fix pass - reuse the basic fix helper to avoid
     # repeating logic. we still run bibfmt once more and uncomment entries
     # after everything settles.
-    for bib in bib_files:
-        format_with_bibfmt(bib)
-        _apply_basic_fixes(bib)
-        uncomment_bibtex_entries(bib)
-        print(f"  ✓ {bib.name}: All fixes applied")
+    format_with_bibfmt(bib_files, stage_cache)
+    _for_each_file(_finish_bib_file, bib_files, jobs, stage_cache)
+    if stage_cache is not None:
+        stage_cache.save()
 
     # final validation/report
-    from .validation import generate_report
     generate_report(bib_files)
 
     print("\nCuration complete!")
@@ -9,13 +9,20 @@ public API unchanged for existing tests and downstream users.
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
 import unicodedata
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from bibtexparser.bibdatabase import BibDatabase  # type: ignore[import]
 
 from . import core
 
+TextFixer = Callable[[str], tuple[str, int]]
+EntryFixer = Callable[[BibDatabase], int]
+
 
 # month abbreviation to integer mapping (shared by fix_legacy_month_fields)
 MONTH_MAP = {
@@ -34,6 +41,110 @@ MONTH_MAP = {
 }
 
 
+def _contains_any(bib_file: Path, needles: tuple[bytes, ...]) -> bool:
+    """Return ``True`` if any of *needles* occurs in *bib_file*.
+
+    The file is memory-mapped so that the common "nothing to fix" case never
+    copies the content into a Python object.  Unreadable files report
+    ``True`` so the caller's regular read path prints the usual error.
+    """
+    try:
+        with open(bib_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return any(mm.find(needle) != -1 for needle in needles)
+    except (OSError, ValueError):
+        return True
+
+
+def _matches(bib_file: Path, pattern: re.Pattern[bytes]) -> bool:
+    """Return ``True`` if the bytes regex *pattern* matches in *bib_file*.
+
+    Same memory-mapped probe as :func:`_contains_any`, for prechecks that
+    need more than a literal substring.
+    """
+    try:
+        with open(bib_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+    except (OSError, ValueError):
+        return True
+
+
+# field values the legacy year/month fixers can change: a year written as a
+# date and a month that is not a plain number.  Anything else parses to a
+# no-op, so files without a match skip the parse/write round trip.
+_DATE_YEAR_PATTERN = r'year\s*=\s*[{"\s]*\d{4}[-/]'
+_NAMED_MONTH_PATTERN = r'month\s*=\s*[{"\s]*[a-z]'
+_DATE_YEAR_RE = re.compile(_DATE_YEAR_PATTERN.encode(), re.IGNORECASE)
+_NAMED_MONTH_RE = re.compile(_NAMED_MONTH_PATTERN.encode(), re.IGNORECASE)
+_DATE_YEAR_TEXT_RE = re.compile(_DATE_YEAR_PATTERN, re.IGNORECASE)
+_NAMED_MONTH_TEXT_RE = re.compile(_NAMED_MONTH_PATTERN, re.IGNORECASE)
+
+
+# byte sequences handled by fix_invalid_utf8_bytes; a doubled backslash
+# followed by a UTF-8 combining mark or one of two Polish letters
+_INVALID_UTF8_REPLACEMENTS = {
+    bytes([0xcc, 0x88]): b'"',        # Lo\\\xcc\x88c -> Lo"c
+    bytes([0xcc, 0x81]): b"\\'",      # X\\\xcc\x81 -> X\'
+    bytes([0xc5, 0x9b]): b"\\'{s}",   # s with acute
+    bytes([0xc5, 0x82]): b"\\l{}",    # l with stroke
+}
+_INVALID_UTF8_PATTERNS = tuple(b'\\\\' + tail for tail in _INVALID_UTF8_REPLACEMENTS)
+# all four sequences in one alternation so the buffer is walked only once
+_INVALID_UTF8_RE = re.compile(
+    rb'\\\\(' + b'|'.join(re.escape(tail) for tail in _INVALID_UTF8_REPLACEMENTS) + rb')'
+)
+# the same sequences once decoded, for fixers working on in-memory text
+_INVALID_UTF8_TEXT_REPLACEMENTS = {
+    tail.decode('utf-8'): repl.decode('utf-8')
+    for tail, repl in _INVALID_UTF8_REPLACEMENTS.items()
+}
+_INVALID_UTF8_TEXT_RE = re.compile(
+    r'\\\\(' + '|'.join(re.escape(tail) for tail in _INVALID_UTF8_TEXT_REPLACEMENTS) + r')'
+)
+
+
+# Every fixer comes in two layers: a private function doing the actual work
+# on in-memory content -- ``(text) -> (new_text, count)`` for text fixers,
+# ``(database) -> count`` for fixers that edit parsed entries in place -- and
+# the public ``fix_*(bib_file)`` wrapper that reads the file, applies it and
+# writes the result back.  :func:`run_basic_fixes` chains the private layer
+# on a :class:`core.BibPipeline` so a whole fix pass costs a single read and
+# write.
+
+def _apply_text_fix(bib_file: Path, fixer: TextFixer, errors: str = 'strict') -> int:
+    """Read *bib_file*, run *fixer* on its text and write back any change."""
+    try:
+        with open(bib_file, 'r', encoding='utf-8', errors=errors) as f:
+            content = f.read()
+    except Exception as e:
+        print(f"  Error reading {bib_file}: {e}")
+        return 0
+    new_content, fixed_count = fixer(content)
+    if new_content != content:
+        try:
+            core.atomic_write_text(bib_file, new_content)
+        except Exception as e:
+            print(f"  Error writing {bib_file}: {e}")
+            return 0
+    return fixed_count
+
+
+def _apply_entry_fix(bib_file: Path, fixer: EntryFixer) -> int:
+    """Parse *bib_file*, run *fixer* on its entries and write back any change."""
+    bib_database = core.parse_bibtex_file(bib_file)
+    if not bib_database:
+        return 0
+    fixed_count = fixer(bib_database)
+    if fixed_count:
+        core.write_bib_file(bib_file, bib_database)
+    return fixed_count
+
+
 def fix_invalid_utf8_bytes(bib_file: Path) -> int:
     """Fix invalid UTF-8 byte sequences that cause LaTeX compilation errors.
 
@@ -42,6 +153,8 @@ def fix_invalid_utf8_bytes(bib_file: Path) -> int:
     - Backslashes incorrectly placed before UTF-8 combining marks
     - Patterns like Lo\\\xcc\x88c -> Lo\"c (LaTeX diaeresis)
     """
+    if not _contains_any(bib_file, _INVALID_UTF8_PATTERNS):
+        return 0
     try:
         # Read as binary to detect and fix byte-level issues
         with open(bib_file, 'rb') as f:
@@ -50,58 +163,16 @@ def fix_invalid_utf8_bytes(bib_file: Path) -> int:
         print(f"  Error reading {bib_file}: {e}")
         return 0
 
-    fixed_count = 0
-    modified = False
-
-    new_content = raw_content
-
-    # pattern1: Lo\\\xcc\x88c -> Lo\"c
-    pattern1 = bytes([0x5c, 0x5c, 0xcc, 0x88])
-    while pattern1 in new_content:
-        pos = new_content.find(pattern1)
-        if pos >= 1:
-            prev_char = new_content[pos - 1:pos]
-            new_content = new_content[:pos-1] + prev_char + b'\"' + new_content[pos+4:]
-            fixed_count += 1
-            modified = True
-        else:
-            new_content = new_content[:pos] + b'\"' + new_content[pos+4:]
-            fixed_count += 1
-            modified = True
-    # pattern2: X\\\xcc\x81 -> X\'
-    pattern2 = bytes([0x5c, 0x5c, 0xcc, 0x81])
-    while pattern2 in new_content:
-        pos = new_content.find(pattern2)
-        if pos >= 1:
-            prev_char = new_content[pos - 1:pos]
-            new_content = new_content[:pos-1] + prev_char + b"\\'" + new_content[pos+4:]
-            fixed_count += 1
-            modified = True
-        else:
-            new_content = new_content[:pos] + b"\\'" + new_content[pos+4:]
-            fixed_count += 1
-            modified = True
-    # ś -> \'{s}
-    pattern3 = bytes([0x5c, 0x5c, 0xc5, 0x9b])
-    if pattern3 in new_content:
-        count = new_content.count(pattern3)
-        new_content = new_content.replace(pattern3, b"\\'{s}")
-        fixed_count += count
-        modified = True
-    # ł -> \l{}
-    pattern4 = bytes([0x5c, 0x5c, 0xc5, 0x82])
-    if pattern4 in new_content:
-        count = new_content.count(pattern4)
-        new_content = new_content.replace(pattern4, b"\\l{}")
-        fixed_count += count
-        modified = True
+    new_content, fixed_count = _INVALID_UTF8_RE.subn(
+        lambda m: _INVALID_UTF8_REPLACEMENTS[m.group(1)], raw_content
+    )
+    modified = fixed_count > 0
 
     if modified:
         try:
             content = new_content.decode('utf-8', errors='replace')
             content = content.replace('\ufffd', '')
-            with open(bib_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            core.atomic_write_text(bib_file, content)
             print(f"  Fixed {fixed_count} invalid UTF-8 byte sequence(s)")
             return fixed_count
         except Exception as e:
@@ -110,6 +181,32 @@ def fix_invalid_utf8_bytes(bib_file: Path) -> int:
     return 0
 
 
+def _fix_invalid_utf8_text(content: str) -> tuple[str, int]:
+    """Text counterpart of :func:`fix_invalid_utf8_bytes` for decoded content."""
+    if '\\\\' not in content:
+        return content, 0
+    new_content, fixed_count = _INVALID_UTF8_TEXT_RE.subn(
+        lambda m: _INVALID_UTF8_TEXT_REPLACEMENTS[m.group(1)], content
+    )
+    if fixed_count:
+        new_content = new_content.replace('\ufffd', '')
+        print(f"  Fixed {fixed_count} invalid UTF-8 byte sequence(s)")
+    return new_content, fixed_count
+
+
+# a letter followed by a combining acute accent, optionally after escaped
+# backslashes
+_COMBINING_ACUTE_RE = re.compile(r'([^\W\d_])\u0301')
+_ESCAPED_COMBINING_ACUTE_RE = re.compile(r'((?:\\\\)*)([^\W\d_])\u0301')
+
+
+def _acute_to_latex(match: re.Match[str]) -> str:
+    char = match.group(1)
+    if char.isalpha():
+        return f"\\'{{{char}}}"
+    return char
+
+
 def fix_problematic_unicode(bib_file: Path) -> int:
     """Fix problematic Unicode characters that cause LaTeX compilation errors.
 
@@ -118,51 +215,55 @@ def fix_problematic_unicode(bib_file: Path) -> int:
     - U+0301 (combining acute accent) to proper LaTeX accent commands
     - Other problematic Unicode characters to LaTeX equivalents
     """
-    try:
-        with open(bib_file, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"  Error reading {bib_file}: {e}")
+    if not _contains_any(bib_file, ('\u2500'.encode(), '\u0301'.encode())):
         return 0
+    return _apply_text_fix(bib_file, _fix_problematic_unicode_text, errors='replace')
+
 
+def _fix_problematic_unicode_text(content: str) -> tuple[str, int]:
+    if '\u2500' not in content and '\u0301' not in content:
+        return content, 0
     lines = content.split('\n')
     fixed_count = 0
     modified = False
 
     for line_num, line in enumerate(lines):
+        # almost every line has neither character; rule it out before
+        # stripping it
+        has_box = '\u2500' in line
+        if not has_box and '\u0301' not in line:
+            continue
         stripped = line.strip()
         if stripped.startswith('%') and not stripped.startswith('@comment'):
             continue
         new_line = line
         original_line = line
-        if '\u2500' in new_line:
+        if has_box:
             new_line = new_line.replace('\u2500', '--')
             fixed_count += 1
             modified = True
         if '\u0301' in new_line:
-            def replace_accent(match):
-                char = match.group(1)
-                if char.isalpha():
-                    return f"\\'{{{char}}}"
-                return char
-            new_line = re.sub(r'([^\W\d_])\u0301', replace_accent, new_line, flags=re.UNICODE)
-            new_line = re.sub(r'((?:\\\\)*)([^\W\d_])\u0301',
-                              lambda m: m.group(1) + f"\\'{{{m.group(2)}}}",
-                              new_line, flags=re.UNICODE)
+            new_line = _COMBINING_ACUTE_RE.sub(_acute_to_latex, new_line)
+            new_line = _ESCAPED_COMBINING_ACUTE_RE.sub(
+                lambda m: m.group(1) + f"\\'{{{m.group(2)}}}", new_line)
             if new_line != original_line:
                 fixed_count += new_line.count("\\'") - original_line.count("\\'")
                 modified = True
         if modified and new_line != original_line:
             lines[line_num] = new_line
-    if modified:
-        try:
-            with open(bib_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
-            print(f"  Fixed {fixed_count} problematic Unicode character(s)")
-        except Exception as e:
-            print(f"  Error writing {bib_file}: {e}")
-            return 0
-    return fixed_count
+    if not modified:
+        return content, 0
+    print(f"  Fixed {fixed_count} problematic Unicode character(s)")
+    return '\n'.join(lines), fixed_count
+
+
+# a bare ``&`` that is not already escaped or the start of an HTML entity
+_BARE_AMP = r'(?<!\\)&(?!amp;|lt;|gt;|quot;|apos;|\\&)'
+_UNESCAPED_AMP_RE = re.compile(_BARE_AMP)
+_FIELD_AMP_RES = tuple(
+    re.compile(rf'({field}\s*=\s*\{{[^}}]*?){_BARE_AMP}([^}}]*?\}})', re.IGNORECASE)
+    for field in ('title', 'journal', 'booktitle')
+)
 
 
 def fix_html_entities(bib_file: Path) -> int:
@@ -170,13 +271,14 @@ def fix_html_entities(bib_file: Path) -> int:
 
     Converts HTML entities to LaTeX equivalents and escapes bare & characters.
     """
-    try:
-        with open(bib_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"  Error reading {bib_file}: {e}")
+    if not _contains_any(bib_file, (b'&',)):
         return 0
+    return _apply_text_fix(bib_file, _fix_html_entities_text)
+
 
+def _fix_html_entities_text(content: str) -> tuple[str, int]:
+    if '&' not in content:
+        return content, 0
     fixed_count = 0
     modified = False
 
@@ -194,44 +296,33 @@ def fix_html_entities(bib_file: Path) -> int:
             fixed_count += count
             modified = True
 
-    field_patterns = [
-        (r'(title\s*=\s*\{[^}]*?)(?<!\\)&(?!amp;|lt;|gt;|quot;|apos;|\\&)([^}]*?\})',
-         r'\1\\&\2'),
-        (r'(journal\s*=\s*\{[^}]*?)(?<!\\)&(?!amp;|lt;|gt;|quot;|apos;|\\&)([^}]*?\})',
-         r'\1\\&\2'),
-        (r'(booktitle\s*=\s*\{[^}]*?)(?<!\\)&(?!amp;|lt;|gt;|quot;|apos;|\\&)([^}]*?\})',
-         r'\1\\&\2'),
-    ]
-    for pattern, replacement in field_patterns:
-        matches = list(re.finditer(pattern, content, re.IGNORECASE))
-        if matches:
-            for match in reversed(matches):
-                content = content[:match.start()] + match.expand(replacement) + content[match.end():]
-                fixed_count += 1
-                modified = True
+    for pattern in _FIELD_AMP_RES:
+        content, count = pattern.subn(r'\1\\&\2', content)
+        if count:
+            fixed_count += count
+            modified = True
 
-    unescaped_pattern = r'(?<!\\)&(?!amp;|lt;|gt;|quot;|apos;|\\&)'
-    matches = list(re.finditer(unescaped_pattern, content))
-    if matches:
-        for match in reversed(matches):
-            pos = match.start()
-            before = content[:pos]
-            open_braces = before.count('{')
-            close_braces = before.count('}')
-            if open_braces > close_braces and (pos == 0 or content[pos-1] != '\\'):
-                content = content[:pos] + '\\&' + content[pos+1:]
-                fixed_count += 1
-                modified = True
+    # escape the remaining bare ``&`` inside braces in one forward pass,
+    # keeping a running brace count instead of recounting the whole prefix
+    # for every match
+    pieces: list[str] = []
+    last = counted = depth = 0
+    for match in _UNESCAPED_AMP_RE.finditer(content):
+        pos = match.start()
+        depth += content.count('{', counted, pos) - content.count('}', counted, pos)
+        counted = pos
+        if depth > 0:
+            pieces.append(content[last:pos])
+            pieces.append('\\&')
+            last = pos + 1
+            fixed_count += 1
+            modified = True
+    if pieces:
+        pieces.append(content[last:])
+        content = ''.join(pieces)
     if modified:
-        try:
-            with open(bib_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  Fixed {fixed_count} HTML entity/entities and unescaped &")
-        except Exception as e:
-            print(f"  Error writing {bib_file}: {e}")
-            return 0
-        return fixed_count
-    return fixed_count
+        print(f"  Fixed {fixed_count} HTML entity/entities and unescaped &")
+    return content, fixed_count
 
 
 
@@ -287,41 +378,38 @@ def fix_unescaped_percent(bib_file: Path | core.BibFile) -> int:
     top-level ``BibFile`` symbol may be missing (see issue reported by user
     during stress testing).
     """
-    @core.field_transform
-    def _escape(value: Any) -> Any:
-        if not isinstance(value, str):
-            return value
-        new_value = value
-        pos = 0
-        changed = False
-        while True:
-            pos = new_value.find('%', pos)
-            if pos == -1:
-                break
-            backslash_count = 0
-            check_pos = pos - 1
-            while check_pos >= 0 and new_value[check_pos] == '\\':
-                backslash_count += 1
-                check_pos -= 1
-            if backslash_count % 2 == 0:
-                new_value = new_value[:pos] + '\\' + new_value[pos:]
-                pos += 2
-                changed = True
-            else:
-                pos += 1
-        return new_value if changed else value
     # convert the argument to a BibFile if necessary (tests pass one in)
     if isinstance(bib_file, core.BibFile):
         bf = bib_file
     else:
+        # a file without any '%' cannot need escaping; skip the parse
+        if not _contains_any(bib_file, (b'%',)):
+            return 0
         bf = core.BibFile(bib_file)
 
-    changed = _escape(bf)
+    changed = _escape_percent(bf)
     if changed:
         bf.write()
     return changed
 
 
+# a ``%`` preceded by an even number (possibly zero) of backslashes, i.e.
+# one that BibTeX would read as the start of a comment
+_UNESCAPED_PERCENT_RE = re.compile(r'(?<!\\)((?:\\\\)*)%')
+
+
+def _escape_percent_value(value: Any) -> Any:
+    if not isinstance(value, str) or '%' not in value:
+        return value
+    new_value, changed = _UNESCAPED_PERCENT_RE.subn(r'\1\\%', value)
+    return new_value if changed else value
+
+
+# field_transform only needs an ``entries`` attribute, so the same callable
+# serves BibFile objects and bare databases
+_escape_percent = core.field_transform(_escape_percent_value)
+
+
 def _heuristic_abbrev(journal: str) -> str:
     """Return an ISO 4 abbreviation for *journal*.
 
@@ -377,15 +465,18 @@ def abbreviate_journal_names(bib_file: Path) -> int:
 
     Returns the number of entries modified.
     """
-    bib_database = core.parse_bibtex_file(bib_file)
-    if not bib_database:
-        return 0
+    return _apply_entry_fix(bib_file, _abbreviate_journals)
+
+
+def _abbreviate_journals(bib_database: BibDatabase) -> int:
     fixed = 0
     # build a case-insensitive lookup so that user data need not match
     # the exact capitalization found in the CSV files.  We normalise keys to
     # lower-case when checking, but preserve the original mapping values in
     # the public dictionary.
     ci_lookup = {k.lower(): v for k, v in JOURNAL_ABBREVIATIONS.items()}
+    # a journal usually appears in many entries; ask iso4 once per name
+    heuristic: dict[str, str] = {}
 
     for entry in bib_database.entries:
         journal = entry.get('journal')
@@ -399,24 +490,34 @@ def abbreviate_journal_names(bib_file: Path) -> int:
             # try a basic fallback abbreviation so we don't rely purely
             # on the mapping; this also covers the case where betterbib
             # crashed earlier in the pipeline.
-            abbrev = _heuristic_abbrev(journal)
+            abbrev = heuristic.get(journal)
+            if abbrev is None:
+                abbrev = heuristic[journal] = _heuristic_abbrev(journal)
             if abbrev != journal:
                 entry['journal'] = abbrev
                 fixed += 1
     if fixed:
-        core.write_bib_file(bib_file, bib_database)
         print(f"  Abbreviated {fixed} journal name(s)")
     return fixed
 
 
+# LaTeX accent commands applied to a braced argument; ``\.`` is the dot
+# accent and, being a regex wildcard, also catches any accent not listed
+_LATEX_ACCENT_RES = tuple(
+    re.compile(rf'\\{accent}\{{([^}}]+)\}}')
+    for accent in ("'", '"', '`', r'\^', '~', '=', '.', 'u', 'v', 'H', 'c')
+)
+
+
 def remove_accents_from_names(bib_file: Path) -> int:
     """Remove accents from author names and other text fields.
 
     The function rewrites entries in place if modifications are made.
     """
-    bib_database = core.parse_bibtex_file(bib_file)
-    if not bib_database:
-        return 0
+    return _apply_entry_fix(bib_file, _remove_accents)
+
+
+def _remove_accents(bib_database: BibDatabase) -> int:
     fixed_count = 0
     modified = False
     text_fields = ['author', 'editor', 'translator', 'title', 'booktitle', 'journal']
@@ -425,103 +526,107 @@ def remove_accents_from_names(bib_file: Path) -> int:
             if field in entry:
                 original_value = entry[field]
                 value = str(original_value)
-                accent_patterns = [
-                    (r"\\'\{([^}]+)\}", r'\1'),
-                    (r'\\"\{([^}]+)\}', r'\1'),
-                    (r"\\`\{([^}]+)\}", r'\1'),
-                    (r"\\\^\{([^}]+)\}", r'\1'),
-                    (r"\\~\{([^}]+)\}", r'\1'),
-                    (r"\\=\{([^}]+)\}", r'\1'),
-                    (r"\\.\{([^}]+)\}", r'\1'),
-                    (r"\\u\{([^}]+)\}", r'\1'),
-                    (r"\\v\{([^}]+)\}", r'\1'),
-                    (r"\\H\{([^}]+)\}", r'\1'),
-                    (r"\\c\{([^}]+)\}", r'\1'),
-                ]
-                for pattern, replacement in accent_patterns:
-                    value = re.sub(pattern, replacement, value)
-                value_normalized = unicodedata.normalize('NFD', value)
-                value_no_accents = ''.join(
-                    char for char in value_normalized
-                    if unicodedata.category(char) != 'Mn'
-                )
-                value_final = unicodedata.normalize('NFC', value_no_accents)
+                if '\\' in value:
+                    for pattern in _LATEX_ACCENT_RES:
+                        value = pattern.sub(r'\1', value)
+                # ASCII text has no combining marks and is its own NFD/NFC
+                if value.isascii():
+                    value_final = value
+                else:
+                    value_normalized = unicodedata.normalize('NFD', value)
+                    value_no_accents = ''.join(
+                        char for char in value_normalized
+                        if unicodedata.category(char) != 'Mn'
+                    )
+                    value_final = unicodedata.normalize('NFC', value_no_accents)
                 if value_final != original_value:
                     entry[field] = value_final
                     fixed_count += 1
                     modified = True
     if modified:
-        core.write_bib_file(bib_file, bib_database)
         print(f"  Removed accents from {fixed_count} field(s)")
         return fixed_count
     return 0
 
 
+# spellings of the date fields checked by the legacy fixers
+_YEAR_KEYS = ('year', 'Year', 'YEAR')
+_MONTH_KEYS = ('month', 'Month', 'MONTH')
+
+# a date-shaped year such as ``{2020-05-01}``; plain years never match
+_LEGACY_YEAR_RE = re.compile(r'\s*\{*(\d{4})[-/]')
+
+
 def fix_legacy_year_fields(bib_file: Path) -> int:
     """Fix legacy year fields that contain dates instead of just the year."""
-    bib_database = core.parse_bibtex_file(bib_file)
-    if not bib_database:
+    if not _matches(bib_file, _DATE_YEAR_RE):
         return 0
+    return _apply_entry_fix(bib_file, _fix_legacy_years)
+
+
+def _fix_legacy_years(bib_database: BibDatabase) -> int:
     fixed_count = 0
     for entry in bib_database.entries:
-        year_keys = ['year', 'Year', 'YEAR']
         year_value = None
         year_key = None
-        for key in year_keys:
+        for key in _YEAR_KEYS:
             if key in entry:
                 year_value = entry[key]
                 year_key = key
                 break
         if year_value:
-            year_clean = str(year_value).strip().strip('{}')
-            try:
-                int(year_clean)
-                continue
-            except ValueError:
-                pass
-            import re
-            date_match = re.match(r'^(\d{4})[-/]', year_clean)
+            date_match = _LEGACY_YEAR_RE.match(str(year_value))
             if date_match:
                 year_only = date_match.group(1)
                 entry[year_key] = year_only
                 fixed_count += 1
     if fixed_count > 0:
-        core.write_bib_file(bib_file, bib_database)
         print(f"  Fixed {fixed_count} legacy year field(s)")
     return fixed_count
 
 
 def fix_legacy_month_fields(bib_file: Path) -> int:
     """Fix legacy month fields by converting abbreviations to integers."""
-    bib_database = core.parse_bibtex_file(bib_file)
-    if not bib_database:
+    if not _matches(bib_file, _NAMED_MONTH_RE):
         return 0
+    return _apply_entry_fix(bib_file, _fix_legacy_months)
+
+
+def _fix_legacy_months(bib_database: BibDatabase) -> int:
     fixed_count = 0
     for entry in bib_database.entries:
-        month_keys = ['month', 'Month', 'MONTH']
         month_value = None
         month_key = None
-        for key in month_keys:
+        for key in _MONTH_KEYS:
             if key in entry:
                 month_value = entry[key]
                 month_key = key
                 break
         if month_value:
-            month_clean = str(month_value).strip().strip('{}').lower()
-            try:
-                int(month_clean)
-                continue
-            except ValueError:
-                pass
-            if month_clean in MONTH_MAP:
-                entry[month_key] = MONTH_MAP[month_clean]
+            # numeric months are never keys of MONTH_MAP, so one lookup
+            # covers both the "already fixed" and the "unknown" case
+            number = MONTH_MAP.get(str(month_value).strip().strip('{}').lower())
+            if number is not None:
+                entry[month_key] = number
                 fixed_count += 1
     if fixed_count > 0:
-        core.write_bib_file(bib_file, bib_database)
         print(f"  Fixed {fixed_count} legacy month field(s)")
     return fixed_count
 
 
+_COMMENTED_ENTRY_RE = re.compile(r'@comment\{@\w+\{')
+_ENTRY_START_RE = re.compile(r'@\w+\{')
+_COMMENTED_ENTRY_KEY_RE = re.compile(r'@comment\{@\w+\{([^,}]+)')
+_COMMENT_OPEN_RE = re.compile(r'^@comment\{', re.MULTILINE)
+# a closing brace directly followed by the next field means a missing comma
+_FIELD_AFTER_NEWLINE_RE = re.compile(r'\}\s*\n\s*(\w+\s*=)')
+_FIELD_AFTER_SPACE_RE = re.compile(r'\}\s+(\w+\s*=)')
+
+
+def _brace_delta(line: str) -> int:
+    return line.count('{') - line.count('}')
+
+
 def uncomment_bibtex_entries(bib_file: Path) -> int:
     """Uncomment BibTeX entries that were commented out by bibfmt.
 
@@ -531,50 +636,53 @@ def uncomment_bibtex_entries(bib_file: Path) -> int:
     entries were recovered.  The function returns the number of entries
     restored.
     """
-    try:
-        with open(bib_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"  Error reading {bib_file}: {e}")
+    if not _contains_any(bib_file, (b'@comment{',)):
         return 0
+    return _apply_text_fix(bib_file, _uncomment_entries_text)
 
+
+def _uncomment_entries_text(content: str) -> tuple[str, int]:
     if '@comment{' not in content:
-        return 0
+        return content, 0
 
     lines = content.split('\n')
-    comment_starts = []
-    for i, line in enumerate(lines):
-        if re.match(r'@comment\{@\w+\{', line):
-            comment_starts.append(i)
+    comment_starts = [
+        i for i, line in enumerate(lines)
+        if line.startswith('@comment{@') and _COMMENTED_ENTRY_RE.match(line)
+    ]
     if not comment_starts:
-        return 0
+        return content, 0
+
+    # Brace balance of every line, computed once up front.  The block scan
+    # below then only sums integers instead of recounting the braces of
+    # each line for every commented-out entry it passes over.
+    deltas = [_brace_delta(line) for line in lines]
 
     fixed_count = 0
     modified = False
     for idx in reversed(range(len(comment_starts))):
         start = comment_starts[idx]
         end = len(lines)
-        brace_count = 0
-        found_opening = False
-        for j in range(start, min(len(lines), start + 200)):
-            line = lines[j]
-            brace_count += line.count('{') - line.count('}')
-            if '@comment{' in line:
-                found_opening = True
-            if found_opening and brace_count <= 0 and j > start:
+        # the start line always contains '@comment{', so the opening brace
+        # is known to be inside the block from the first line on
+        brace_count = deltas[start]
+        for j in range(start + 1, min(len(lines), start + 200)):
+            brace_count += deltas[j]
+            if brace_count <= 0:
                 end = j + 1
                 break
-            if j > start and re.match(r'@\w+\{', line) and not line.startswith('@comment'):
+            line = lines[j]
+            if line.startswith('@') and _ENTRY_START_RE.match(line) and not line.startswith('@comment'):
                 end = j
                 break
         entry_lines = lines[start:end]
         entry_text = '\n'.join(entry_lines)
-        entry_key_match = re.search(r'@comment\{@\w+\{([^,}]+)', entry_text)
+        entry_key_match = _COMMENTED_ENTRY_KEY_RE.search(entry_text)
         if not entry_key_match:
             continue
-        entry_content = re.sub(r'^@comment\{', '', entry_text, count=1, flags=re.MULTILINE)
-        entry_content = re.sub(r'\}\s*\n\s*(\w+\s*=)', r'},\n  \1', entry_content)
-        entry_content = re.sub(r'\}\s+(\w+\s*=)', r'}, \1', entry_content)
+        entry_content = _COMMENT_OPEN_RE.sub('', entry_text, count=1)
+        entry_content = _FIELD_AFTER_NEWLINE_RE.sub(r'},\n  \1', entry_content)
+        entry_content = _FIELD_AFTER_SPACE_RE.sub(r'}, \1', entry_content)
         open_braces = entry_content.count('{')
         close_braces = entry_content.count('}')
         missing_braces = open_braces - close_braces
@@ -600,19 +708,15 @@ def uncomment_bibtex_entries(bib_file: Path) -> int:
                 for _ in range(-diff):
                     if entry_content.endswith('}'):
                         entry_content = entry_content[:-1].rstrip()
-        new_lines = lines[:start] + entry_content.split('\n') + lines[end:]
-        lines = new_lines
+        restored = entry_content.split('\n')
+        lines[start:end] = restored
+        deltas[start:end] = [_brace_delta(line) for line in restored]
         fixed_count += 1
         modified = True
-    if modified:
-        try:
-            with open(bib_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
-            print(f"  Uncommented {fixed_count} entry/entries")
-        except Exception as e:
-            print(f"  Error writing {bib_file}: {e}")
-            return 0
-    return fixed_count
+    if not modified:
+        return content, 0
+    print(f"  Uncommented {fixed_count} entry/entries")
+    return '\n'.join(lines), fixed_count
 
 
 def fix_malformed_author_fields(bib_file: Path) -> int:
@@ -622,9 +726,58 @@ def fix_malformed_author_fields(bib_file: Path) -> int:
     legacy CLI.  Heuristics are intentionally simple and widely tested in
     :mod:`tests.test_cli_helpers`.
     """
-    bib_database = core.parse_bibtex_file(bib_file)
-    if not bib_database:
-        return 0
+    return _apply_entry_fix(bib_file, _fix_malformed_authors)
+
+
+# backslash repairs for author fields; every pattern needs a backslash, so
+# fields without one skip straight to the Unicode replacements
+_EXCESS_BS_LETTERS_RE = re.compile(r'([A-Za-z])\\{4,}([a-z]+)')
+_EXCESS_BS_RE = re.compile(r'\\{4,}')
+_AUTHOR_BACKSLASH_SUBS = (
+    # incomplete names ending with backslash
+    (re.compile(r',\s*\\+\s*([,}])'), r',\1'),
+    (re.compile(r'([A-Za-z])\s*\\+\s*$'), r'\1'),
+)
+
+
+def _fix_excessive_backslashes(text: str) -> str:
+    if '\\\\\\\\' not in text:
+        # both patterns need a run of at least four backslashes
+        return text
+    text = _EXCESS_BS_LETTERS_RE.sub(r'\1{\\"u}\2', text)
+    return _EXCESS_BS_RE.sub(r'\\', text)
+
+# mangled accent commands, replaced literally
+_AUTHOR_ACCENT_FIXES = {
+    '\\ν': "\\'{n}",
+    '\\μ': "\\'{u}",
+    '\\149': "\\'{n}",
+}
+_AUTHOR_UNICODE_TO_LATEX = {
+    'ń': r"\\'{n}",
+    'á': r"\\'{a}",
+    'é': r"\\'{e}",
+    'í': r"\\'{i}",
+    'ó': r"\\'{o}",
+    'ú': r"\\'{u}",
+    'ü': r'\\"{u}',
+    'ö': r'\\"{o}',
+    'ł': r'\\l{}',
+    'ć': r"\\'{c}",
+    'ś': r"\\'{s}",
+    'ź': r"\\'{z}",
+    'ą': r"\\'{a}",
+    'ę': r"\\'{e}",
+}
+# the accent fixes all start with a backslash and are applied in one regex
+# pass; the Unicode table maps single characters, which str.translate
+# handles in one C-level pass.  No key reappears in a replacement, so this
+# matches applying the replacements one after the other.
+_AUTHOR_ACCENT_RE = re.compile('|'.join(map(re.escape, _AUTHOR_ACCENT_FIXES)))
+_AUTHOR_UNICODE_TABLE = str.maketrans(_AUTHOR_UNICODE_TO_LATEX)
+
+
+def _fix_malformed_authors(bib_database: BibDatabase) -> int:
     fixed_count = 0
     modified = False
     for entry in bib_database.entries:
@@ -633,43 +786,46 @@ def fix_malformed_author_fields(bib_file: Path) -> int:
         original_value = entry['author']
         value = str(original_value)
         original_value_str = value
-        # remove excessive backslashes
-        value = re.sub(r'([A-Za-z])\\{4,}([a-z]+)', r'\1{\\"u}\2', value)
-        value = re.sub(r'\\{4,}', r'\\', value)
-        # incomplete names ending with backslash
-        value = re.sub(r',\s*\\+\s*([,}])', r',\1', value)
-        value = re.sub(r'([A-Za-z])\s*\\+\s*$', r'\1', value)
-        accent_fixes = {
-            r'\\ν': r"\\'{n}",
-            r'\\μ': r"\\'{u}",
-            r'\\149': r"\\'{n}",
-        }
-        for pattern, replacement in accent_fixes.items():
-            value = re.sub(pattern, replacement, value)
-        unicode_to_latex = {
-            'ń': r"\\'{n}",
-            'á': r"\\'{a}",
-            'é': r"\\'{e}",
-            'í': r"\\'{i}",
-            'ó': r"\\'{o}",
-            'ú': r"\\'{u}",
-            'ü': r'\\"{u}',
-            'ö': r'\\"{o}',
-            'ł': r'\\l{}',
-            'ć': r"\\'{c}",
-            'ś': r"\\'{s}",
-            'ź': r"\\'{z}",
-            'ą': r"\\'{a}",
-            'ę': r"\\'{e}",
-        }
-        for unicode_char, latex_cmd in unicode_to_latex.items():
-            if unicode_char in value:
-                value = value.replace(unicode_char, latex_cmd)
+        if '\\' in value:
+            value = _fix_excessive_backslashes(value)
+            for pattern, replacement in _AUTHOR_BACKSLASH_SUBS:
+                value = pattern.sub(replacement, value)
+            value = _AUTHOR_ACCENT_RE.sub(lambda m: _AUTHOR_ACCENT_FIXES[m.group(0)], value)
+        value = value.translate(_AUTHOR_UNICODE_TABLE)
         if value != original_value_str:
             entry['author'] = value
             fixed_count += 1
             modified = True
     if modified:
-        core.write_bib_file(bib_file, bib_database)
         print(f"  Fixed {fixed_count} malformed author field(s)")
     return fixed_count
+
+
+def run_basic_fixes(pipeline: core.BibPipeline) -> None:
+    """Apply the standard fixers, in order, to *pipeline*'s content.
+
+    This is the in-memory equivalent of calling ``fix_invalid_utf8_bytes``,
+    ``fix_html_entities``, ``fix_malformed_author_fields``,
+    ``remove_accents_from_names``, ``fix_problematic_unicode``,
+    ``abbreviate_journal_names``, ``fix_unescaped_percent``,
+    ``fix_legacy_year_fields`` and ``fix_legacy_month_fields`` one after the
+    other; the caller decides when to :meth:`~core.BibPipeline.flush`.
+    """
+    pipeline.apply_text_fixer(_fix_invalid_utf8_text)
+    pipeline.apply_text_fixer(_fix_html_entities_text)
+    pipeline.apply_entry_fixer(_fix_malformed_authors)
+    pipeline.apply_entry_fixer(_remove_accents)
+    pipeline.apply_text_fixer(_fix_problematic_unicode_text)
+    pipeline.apply_entry_fixer(_abbreviate_journals)
+    pipeline.apply_entry_fixer(_escape_percent, precheck=lambda text: '%' in text)
+    pipeline.apply_entry_fixer(
+        _fix_legacy_years, precheck=lambda text: _DATE_YEAR_TEXT_RE.search(text) is not None
+    )
+    pipeline.apply_entry_fixer(
+        _fix_legacy_months, precheck=lambda text: _NAMED_MONTH_TEXT_RE.search(text) is not None
+    )
+
+
+def recover_commented_entries(pipeline: core.BibPipeline) -> int:
+    """In-memory counterpart of :func:`uncomment_bibtex_entries`."""
+    return pipeline.apply_text_fixer(_uncomment_entries_text)
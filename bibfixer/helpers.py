@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Mapping, Set, Dict
+from typing import Callable, Iterable, Mapping, Set, Dict
 import re
 
+from bibtexparser.bibdatabase import BibDatabase  # type: ignore[import]
+
 from . import utils
-from .core import parse_bibtex_file, write_bib_file
+from .core import atomic_write_text, parse_bibtex_file, write_bib_file
 
 
 # common citation patterns used when parsing and rewriting
@@ -19,9 +22,10 @@ from .core import parse_bibtex_file, write_bib_file
 # maintaining a long hard-coded list we match any command containing the
 # word ``cite`` with optional alphabetic prefixes/suffixes.  This keeps
 # the behaviour broad enough for most LaTeX packages while remaining easy
-# to test.
-CITATION_PATTERNS: list[str] = [
-    r'\\[A-Za-z]*cite[a-zA-Z]*\{([^}]+)\}',
+# to test.  The patterns are compiled once here; callers extending the
+# list should append compiled patterns as well.
+CITATION_PATTERNS: list[re.Pattern[str]] = [
+    re.compile(r'\\[A-Za-z]*cite[a-zA-Z]*\{([^}]+)\}'),
 ]
 
 
@@ -88,9 +92,8 @@ def collect_all_bib_files() -> list[Path]:
             bib_list.append(path)
 
     if not bib_list:
-        for path in sorted(Path('.').glob('*.bib')):
-            if not path.name.endswith('.backup'):
-                bib_list.append(path)
+        # backups are named ``*.bib.backup`` and never match this pattern
+        bib_list.extend(sorted(Path('.').glob('*.bib')))
 
     return sorted(bib_list)
 
@@ -107,13 +110,17 @@ def extract_citations_from_tex(tex_file: Path) -> Set[str]:
             content = f.read()
     except Exception:
         return set()
+    return set(_citations_in(content, tuple(CITATION_PATTERNS)))
 
-    # patterns defined at module level to keep behaviour consistent
-    patterns = CITATION_PATTERNS
 
+# validation, unused-entry removal and the summary all extract citations
+# from the same unchanged sources; keyed on content (and the patterns, which
+# callers may extend), a rewrite is never missed
+@lru_cache(maxsize=64)
+def _citations_in(content: str, patterns: tuple[re.Pattern[str], ...]) -> frozenset[str]:
     citations: Set[str] = set()
     for pattern in patterns:
-        for match in re.findall(pattern, content):
+        for match in pattern.findall(content):
             keys = [k.strip() for k in match.split(',')]
             citations.update(keys)
 
@@ -122,7 +129,7 @@ def extract_citations_from_tex(tex_file: Path) -> Set[str]:
         nk = utils.normalize_unicode(k)
         if nk:
             normalized.add(nk)
-    return normalized
+    return frozenset(normalized)
 
 
 def update_tex_citations(tex_files: Iterable[Path],
@@ -162,47 +169,90 @@ def update_tex_citations(tex_files: Iterable[Path],
                 if k not in seen:
                     seen.add(k)
                     deduped.append(k)
-            return match.group(0).replace(keys_str, ', '.join(deduped))
+            # splice by offset so a key that also occurs in the command
+            # name (``\cite{cite}``) cannot be rewritten there
+            whole = match.group(0)
+            start = match.start(1) - match.start(0)
+            end = match.end(1) - match.start(0)
+            return whole[:start] + ', '.join(deduped) + whole[end:]
 
         for pattern in patterns:
-            content = re.sub(pattern, replace_citations, content)
+            content = pattern.sub(replace_citations, content)
 
         if content != original_content:
-            with open(tex_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            atomic_write_text(tex_file, content)
 
 
-def sanitize_citation_keys(bib_file: Path) -> Dict[str, str]:
-    """Remove problematic characters from entry keys in *bib_file*.
+KeyRule = Callable[[BibDatabase], Dict[str, str]]
 
-    Returns a mapping from old normalized key to new key.  The file is
-    rewritten in place if any changes are made.
+
+def _rewrite_keys(bib_file: Path, *rules: KeyRule) -> Dict[str, str]:
+    """Apply key *rules* to *bib_file* in one parse/write cycle.
+
+    Each rule renames entries in place and returns its own old -> new
+    mapping.  The mappings are chained so that the result maps every
+    original normalized key straight to its final key.
     """
     bib_database = parse_bibtex_file(bib_file)
     if not bib_database:
         return {}
 
-    modified = False
     key_mapping: Dict[str, str] = {}
-    fixed_count = 0
+    for rule in rules:
+        step = rule(bib_database)
+        for old, new in key_mapping.items():
+            key_mapping[old] = step.get(utils.normalize_unicode(new), new)
+        for old, new in step.items():
+            key_mapping.setdefault(old, new)
+
+    if key_mapping:
+        write_bib_file(bib_file, bib_database)
+    return key_mapping
+
+
+# characters stripped from keys by sanitisation and key generation
+_UNSAFE_KEY_CHARS_RE = re.compile(r"[^A-Za-z0-9_:\-]+")
+_NON_LETTER_RE = re.compile(r"[^A-Za-z]")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]")
+
 
+def _sanitize_keys(bib_database: BibDatabase) -> Dict[str, str]:
+    key_mapping: Dict[str, str] = {}
     for entry in bib_database.entries:
         orig = entry.get('ID', '')
         original_key = utils.normalize_unicode(orig)
         if not original_key:
             continue
-        sanitized_key = re.sub(r"[^A-Za-z0-9_:\-]+", "", original_key)
+        sanitized_key = _UNSAFE_KEY_CHARS_RE.sub("", original_key)
         if sanitized_key and sanitized_key != original_key:
             entry['ID'] = sanitized_key
             key_mapping[original_key] = sanitized_key
-            fixed_count += 1
-            modified = True
-
-    if modified:
-        write_bib_file(bib_file, bib_database)
     return key_mapping
 
 
+def sanitize_citation_keys(bib_file: Path) -> Dict[str, str]:
+    """Remove problematic characters from entry keys in *bib_file*.
+
+    Returns a mapping from old normalized key to new key.  The file is
+    rewritten in place if any changes are made.
+    """
+    return _rewrite_keys(bib_file, _sanitize_keys)
+
+
+def fix_citation_keys(bib_file: Path, standardize: bool = True) -> Dict[str, str]:
+    """Sanitize and optionally standardize keys with a single rewrite.
+
+    Equivalent to :func:`sanitize_citation_keys` followed by
+    :func:`standardize_citation_keys`, except that the file is parsed and
+    written once and the returned mapping goes from each original key
+    directly to its final key.
+    """
+    if standardize:
+        return _rewrite_keys(bib_file, _sanitize_keys, _standardize_keys)
+    return _rewrite_keys(bib_file, _sanitize_keys)
+
+
 def _generate_citation_key(entry: dict) -> str:
     """Build a key in AuthorYearJournalFirstTitleWord format from a BibTeX entry."""
     # last name of first author
@@ -214,8 +264,8 @@ def _generate_citation_key(entry: dict) -> str:
             last = first_author.split(',')[0]
         else:
             last = first_author.split()[-1]
-        last = re.sub(r"[^A-Za-z]", "", last)
-    year = re.sub(r"[^0-9]", "", str(entry.get('year', '')))
+        last = _NON_LETTER_RE.sub("", last)
+    year = _NON_DIGIT_RE.sub("", str(entry.get('year', '')))
     journal = entry.get('journal', '')
     jabr = ''
     if journal:
@@ -223,7 +273,7 @@ def _generate_citation_key(entry: dict) -> str:
     title = entry.get('title', '')
     firstword = ''
     if title:
-        firstword = re.sub(r"[^A-Za-z0-9]", "", title.split()[0])
+        firstword = _NON_ALNUM_RE.sub("", title.split()[0])
     key = f"{last}{year}{jabr}{firstword}"
     if key and not key[0].isalpha():
         key = f"k{key}"
@@ -237,12 +287,15 @@ def standardize_citation_keys(bib_file: Path) -> Dict[str, str]:
     Collisions are avoided by appending a counter.
     Returns mapping from old normalized key to new key.
     """
-    bib_database = parse_bibtex_file(bib_file)
-    if not bib_database:
-        return {}
+    return _rewrite_keys(bib_file, _standardize_keys)
+
 
+def _standardize_keys(bib_database: BibDatabase) -> Dict[str, str]:
     key_mapping: Dict[str, str] = {}
     used_keys: Set[str] = set()
+    # next counter to try per generated key; every smaller suffix is taken
+    # already, so many entries sharing a base do not rescan from 1
+    next_suffix: Dict[str, int] = {}
 
     for entry in bib_database.entries:
         orig = entry.get('ID', '')
@@ -254,14 +307,13 @@ def standardize_citation_keys(bib_file: Path) -> Dict[str, str]:
             used_keys.add(norm)
             continue
         base = new_key
-        i = 1
+        i = next_suffix.get(base, 1)
         while new_key in used_keys:
             new_key = f"{base}{i}"
             i += 1
+        next_suffix[base] = i
         entry['ID'] = new_key
         key_mapping[norm] = new_key
         used_keys.add(new_key)
 
-    if key_mapping:
-        write_bib_file(bib_file, bib_database)
     return key_mapping
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import difflib
 import unicodedata
 import re
+import sys
+from functools import lru_cache
 from typing import Optional
 
+# Keys, DOIs and titles are normalised again by every duplicate check,
+# report and consolidation step, usually for the same few thousand strings;
+# memoise the pure normalisers so repeats are a dictionary lookup.
+_NORMALIZE_CACHE_SIZE = 16384
 
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_unicode(text: Optional[str]) -> Optional[str]:
     """Normalize Unicode strings for comparison.
 
@@ -14,9 +23,20 @@ def normalize_unicode(text: Optional[str]) -> Optional[str]:
     """
     if not text:
         return None
-    return unicodedata.normalize("NFC", str(text))
+    text = str(text)
+    # ASCII text is already in NFC; most keys are plain ASCII
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text)
+    # keys end up in many sets at once; interning makes every copy the same
+    # object, even after the entry has dropped out of the cache
+    return sys.intern(text)
+
 
+# resolver prefixes, with or without ``dx.`` and over either scheme
+_DOI_URL_PREFIX_RE = re.compile(r"^https?://(?:dx\.)?doi\.org/")
 
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_doi(doi: Optional[str]) -> Optional[str]:
     """Normalize DOI strings to a canonical lowercase form without prefix."""
     if not doi:
@@ -27,21 +47,21 @@ def normalize_doi(doi: Optional[str]) -> Optional[str]:
         return None
     if doi.startswith("doi:"):
         doi = doi[4:]
-    if doi.startswith("http://dx.doi.org/"):
-        # prefix length is 18 characters, not 19; avoid dropping the leading digit
-        doi = doi[18:]
-    if doi.startswith("https://doi.org/"):
-        doi = doi[16:]
+    if doi.startswith("http"):
+        doi = _DOI_URL_PREFIX_RE.sub("", doi, count=1)
     return doi.strip()
 
 
+_URL_SCHEME_RE = re.compile(r"^[A-Za-z]+://")
+
+
 def normalize_url(url: Optional[str]) -> Optional[str]:
     """Basic URL cleaning: strip whitespace and lower-case scheme."""
     if not url:
         return None
     url = str(url).strip()
     # lower-case scheme only (e.g. "HTTP://" -> "http://")
-    return re.sub(r"^[A-Za-z]+://", lambda m: m.group(0).lower(), url)
+    return _URL_SCHEME_RE.sub(lambda m: m.group(0).lower(), url)
 
 
 def normalize_keywords(keywords: Optional[str]) -> Optional[str]:
@@ -60,15 +80,64 @@ def normalize_keywords(keywords: Optional[str]) -> Optional[str]:
 
 
 
+_DASH_RUN_RE = re.compile(r'[-–—]+')
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_title(title: str) -> str:
     """Canonicalise a title for loose comparisons.
 
     Removes braces, collapses whitespace and punctuation, and lowercases the
     result.  This is used by both curation and validation routines.
     """
-    title = re.sub(r'[{}]', '', str(title))
-    # replace runs of hyphens or dashes with a single space
-    title = re.sub(r'[-–—]+', ' ', title)
-    # collapse any remaining whitespace
-    title = re.sub(r'\s+', ' ', title)
-    return title.strip().lower()
+    title = str(title)
+    if '{' in title or '}' in title:
+        title = title.replace('{', '').replace('}', '')
+    # replace runs of hyphens or dashes with a single space; plain ASCII
+    # titles can only contain the hyphen, which a substring test rules out
+    if '-' in title or not title.isascii():
+        title = _DASH_RUN_RE.sub(' ', title)
+    # collapse any remaining whitespace; split() without arguments uses the
+    # same notion of whitespace as ``\s`` and drops the ends as well
+    return ' '.join(title.split()).lower()
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def titles_similar(a: str, b: str, threshold: float = 0.85) -> bool:
+    """Return ``True`` if two titles are close enough to count as the same.
+
+    This is a token-set comparison: both titles are canonicalised with
+    :func:`normalize_title` and split into word sets, ignoring
+    punctuation.  The shared words,
+    and the shared words plus each side's extra words, are joined in sorted
+    order and compared pairwise with :class:`difflib.SequenceMatcher`.  The
+    titles match when the best score reaches *threshold*.  Brace, case,
+    spacing and word-order changes are therefore ignored, a title that only
+    gains or loses words still matches, and small typo fixes score high.
+    Each pair is checked against the matcher's cheap upper bounds before
+    the full ratio is computed.
+    """
+    wa = set(_WORD_RE.findall(normalize_title(a)))
+    wb = set(_WORD_RE.findall(normalize_title(b)))
+    if not wa or not wb:
+        return wa == wb
+    common = ' '.join(sorted(wa & wb))
+    only_a = ' '.join(sorted(wa - wb))
+    only_b = ' '.join(sorted(wb - wa))
+    if not only_a or not only_b:
+        return True
+    full_a = f"{common} {only_a}".strip()
+    full_b = f"{common} {only_b}".strip()
+    for x, y in ((common, full_a), (common, full_b), (full_a, full_b)):
+        if not x:
+            continue
+        matcher = difflib.SequenceMatcher(None, x, y, autojunk=False)
+        if (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        ):
+            return True
+    return False
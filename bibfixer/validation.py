@@ -7,13 +7,69 @@ implemented inline inside ``cli.py``.  They are mostly useful for the
 
 from __future__ import annotations
 
+import importlib.util
+import mmap
+import os
 import re
-from collections import defaultdict
 from pathlib import Path
 from typing import Iterable, List
 
-from . import core, utils, helpers
-from .core import BibFile
+from bibtexparser.bibdatabase import BibDatabase  # type: ignore[import]
+
+from . import __version__, core, utils, helpers
+from .cache import StageCache, cache_enabled
+
+# entries that bibfmt wrapped in ``@comment{...}``; bibtexparser keeps the
+# inner text of every comment block, so the key is read from that
+_COMMENTED_ENTRY_RE = re.compile(r'@\w+\{([^,}]+)')
+
+
+def _commented_keys(comments: Iterable[str]) -> set[str]:
+    """Return the normalised keys of entries commented out in *comments*."""
+    keys: set[str] = set()
+    for comment in comments:
+        match = _COMMENTED_ENTRY_RE.match(comment)
+        if match:
+            norm = utils.normalize_unicode(match.group(1).strip())
+            if norm:
+                keys.add(norm)
+    return keys
+
+
+def _unescaped_percent_lines(bib: Path) -> int:
+    """Return how many non-comment lines of *bib* hold an unescaped ``%``.
+
+    The file is memory-mapped and the scan jumps from one ``%`` byte to the
+    next with ``find``, so text without any ``%`` is skipped at memchr
+    speed; backslash parity and line bounds are only looked at around hits,
+    and each line is counted once.
+    """
+    count = 0
+    try:
+        with open(bib, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(b'%')
+                while pos != -1:
+                    # escaped when preceded by an odd number of backslashes
+                    prev = pos
+                    while prev and mm[prev - 1] == 0x5C:
+                        prev -= 1
+                    if (pos - prev) % 2:
+                        pos = mm.find(b'%', pos + 1)
+                        continue
+                    start = mm.rfind(b'\n', 0, pos) + 1
+                    line_end = mm.find(b'\n', pos)
+                    if line_end == -1:
+                        line_end = len(mm)
+                    # skip commented lines
+                    if not mm[start:pos + 1].lstrip().startswith(b'%'):
+                        count += 1
+                    pos = mm.find(b'%', line_end)
+    except (OSError, ValueError):
+        pass
+    return count
 
 
 def validate_citations() -> List[str]:
@@ -21,42 +77,53 @@ def validate_citations() -> List[str]:
 
     Returns a list of issue descriptions (empty if everything checks out).
     """
+    return _validate_citations()[0]
+
+
+def _validate_citations(
+    databases: list[BibDatabase] | None = None,
+) -> tuple[List[str], set[str], set[str]]:
+    """Body of :func:`validate_citations`.
+
+    Also returns every bib key and every citation it saw so that
+    :func:`validate_bibliography` can hand them to :func:`generate_summary`
+    instead of reading all files a second time.  *databases* are the parsed
+    bib files when the caller already has them.
+    """
     tex_files = helpers.collect_all_tex_files()
-    bib_files = helpers.collect_all_bib_files()
+    if databases is None:
+        databases = [core.parse_bibtex_file(bib) for bib in helpers.collect_all_bib_files()]
 
     all_issues: List[str] = []
     total_citations = 0
     total_valid = 0
 
-    all_bib_entries = set()
+    all_bib_entries: set[str] = set()
+    all_citations: set[str] = set()
     commented_entries = set()
     crossrefs: dict[str, str] = {}
 
-    for bib in bib_files:
-        if bib.name.endswith('.backup'):
-            continue
-        for entry in core.parse_bib_file(bib):
+    # collect_all_bib_files never returns backups
+    for db in databases:
+        for entry in db.entries:
             k = utils.normalize_unicode(entry.get('ID', ''))
             if k:
                 all_bib_entries.add(k)
-                cr = entry.get('crossref') or entry.get('Crossref', '')
+                cr = entry.get('crossref')
                 # normalize_unicode may return None; only record if we got a
                 # real string so the dict stays typed correctly.
                 if cr:
                     norm_cr = utils.normalize_unicode(cr)
                     if norm_cr:
                         crossrefs[k] = norm_cr
-        try:
-            content = bib.read_text(encoding='utf-8')
-        except Exception:
-            content = ''
-        for match in re.finditer(r'@comment\s*\{@\w+\{([^,}]+)', content):
-            commented_entries.add(utils.normalize_unicode(match.group(1).strip()))
+        commented_entries.update(_commented_keys(db.comments))
 
     missing_keys: set[str] = set()
     commented_keys: set[str] = set()
 
     for tex in tex_files:
+        citations = helpers.extract_citations_from_tex(tex)
+        all_citations |= citations
         # ``get_corresponding_bib`` returns ``Optional[Path]`` so store it
         # in a differently named variable to avoid shadowing the ``bib``
         # loop variable used above.
@@ -64,10 +131,11 @@ def validate_citations() -> List[str]:
         if not corresponding_bib:
             all_issues.append(f"{tex.name}: no bib file")
             continue
-        citations = helpers.extract_citations_from_tex(tex)
         total_citations += len(citations)
         missing = citations - all_bib_entries
-        commented = [c for c in citations if utils.normalize_unicode(c) in commented_entries]
+        # extracted citations are already normalised, so this is a plain
+        # set intersection
+        commented = citations & commented_entries
         if missing:
             missing_keys.update(missing)
             all_issues.extend(f"{tex.name}: missing {k}" for k in sorted(missing))
@@ -102,7 +170,7 @@ def validate_citations() -> List[str]:
         print(f"  Commented-out citation keys ({len(commented_keys)}): {', '.join(sorted(commented_keys)[:10])}")
         if len(commented_keys) > 10:
             print("  ...")
-    return all_issues
+    return all_issues, all_bib_entries, all_citations
 
 
 def validate_bib_file(bib_file: Path):
@@ -150,53 +218,75 @@ def generate_report(bib_files: Iterable[Path], before_stats=None) -> None:
             print(f"  Entries with DOI: {stats['entries_with_doi']} (N/A)")
 
 
+def _parse_all(bibs: Iterable[Path]) -> Iterable[BibDatabase]:
+    """Yield the parsed database of each of *bibs*, one at a time."""
+    return (core.parse_bibtex_file(bib) for bib in bibs)
+
+
 def check_duplicate_titles() -> int:
     """Return count of normalized-title duplicates across bib files."""
-    bibs = helpers.collect_all_bib_files()
-    seen: dict[str, list] = defaultdict(list)
-    for bib in bibs:
-        for entry in core.parse_bib_file(bib):
-            title = entry.get('title', '')
+    return _count_duplicate_titles(_parse_all(helpers.collect_all_bib_files()))
+
+
+def _count_duplicate_titles(databases: Iterable[BibDatabase]) -> int:
+    # most titles occur once, so only a set of seen titles is kept and no
+    # per-title record is built
+    seen: set[str] = set()
+    duplicates: set[str] = set()
+    for db in databases:
+        for entry in db.entries:
+            title = entry.get('title')
+            if not title:
+                continue
             norm = utils.normalize_title(title)
             if norm:
-                seen[norm].append({'key': entry.get('ID', ''), 'file': bib.name})
-    duplicates = {t: e for t, e in seen.items() if len(e) > 1}
+                if norm in seen:
+                    duplicates.add(norm)
+                else:
+                    seen.add(norm)
     return len(duplicates)
 
 
 def check_duplicate_keys() -> bool:
     """Return ``True`` if there are any duplicate keys across files."""
     bibs = helpers.collect_all_bib_files()
-    keys: dict[str, list] = defaultdict(list)
-    for bib in bibs:
-        for entry in core.parse_bib_file(bib):
+    if not core.scan_duplicate_candidates(bibs)[0]:
+        return False
+    seen: set[str] = set()
+    for db in _parse_all(bibs):
+        for entry in db.entries:
             k = utils.normalize_unicode(entry.get('ID', ''))
-            if k:
-                keys[k].append(str(bib))
-    dup = {k: v for k, v in keys.items() if len(v) > 1}
-    return bool(dup)
+            if not k:
+                continue
+            if k in seen:
+                # one duplicate settles the answer; no need to parse the rest
+                return True
+            seen.add(k)
+    return False
 
 
 def check_duplicate_dois() -> int:
     bibs = helpers.collect_all_bib_files()
-    doi_map: dict[str, list] = defaultdict(list)
-    for bib in bibs:
-        bf = BibFile(bib)
-        for entry in bf.entries:
-            k = utils.normalize_unicode(entry.get('ID', ''))
-            norm = utils.normalize_doi(entry.get('doi') or entry.get('DOI') or entry.get('Doi'))
-            if norm:
-                # ``EntryMeta`` requires a non‑None key; falling back to empty
-                # string is safe because the algorithms below only care about
-                # duplicates and an empty key will simply be ignored in practice.
-                doi_map[norm].append(
-                    core.EntryMeta(key=k or '', file=bf.path, entry=entry)
-                )
-    count = 0
-    for doi, metas in doi_map.items():
-        if len({m.key for m in metas}) > 1:
-            count += 1
-    return count
+    if not core.scan_duplicate_candidates(bibs)[1]:
+        return 0
+    return _count_duplicate_dois(_parse_all(bibs))
+
+
+def _count_duplicate_dois(databases: Iterable[BibDatabase]) -> int:
+    # a DOI is duplicated when it is shared by two different keys, whatever
+    # the entries contain; remembering the first key seen per DOI is enough
+    first_key: dict[str, str] = {}
+    duplicates: set[str] = set()
+    for db in databases:
+        for entry in db.entries:
+            norm = utils.normalize_doi(entry.get('doi'))
+            if not norm:
+                continue
+            # an empty key still counts as a distinct key, as before
+            key = utils.normalize_unicode(entry.get('ID', '')) or ''
+            if first_key.setdefault(norm, key) != key:
+                duplicates.add(norm)
+    return len(duplicates)
 
 
 def check_unescaped_percent() -> int:
@@ -204,31 +294,7 @@ def check_unescaped_percent() -> int:
     bibs = helpers.collect_all_bib_files()
     issues = 0
     for bib in bibs:
-        try:
-            text = bib.read_text(encoding='utf-8')
-        except Exception:
-            continue
-        for line in text.splitlines():
-            stripped = line.strip()
-            # skip commented lines
-            if stripped.startswith('%'):
-                continue
-            idx = 0
-            while True:
-                idx = line.find('%', idx)
-                if idx == -1:
-                    break
-                # count preceding backslashes
-                bs = 0
-                j = idx - 1
-                while j >= 0 and line[j] == '\\':
-                    bs += 1
-                    j -= 1
-                if bs % 2 == 0:
-                    issues += 1
-                    idx = len(line)  # stop scanning this line
-                else:
-                    idx += 1
+        issues += _unescaped_percent_lines(bib)
     return issues
 
 
@@ -242,55 +308,117 @@ def check_file_correspondence() -> bool:
     return ok
 
 
-def generate_summary():
-    """Print a very small summary used by the CLI workflow."""
+def generate_summary(
+    all_keys: set[str] | None = None,
+    all_citations: set[str] | None = None,
+):
+    """Print a very small summary used by the CLI workflow.
+
+    *all_keys* and *all_citations* may be passed in when the caller already
+    collected them; otherwise the files are read here.
+    """
     tex_files = helpers.collect_all_tex_files()
     bib_files = helpers.collect_all_bib_files()
-    all_keys = set()
-    all_citations = set()
-    for bib in bib_files:
-        for entry in core.parse_bib_file(bib):
-            k = utils.normalize_unicode(entry.get('ID', ''))
-            if k:
-                all_keys.add(k)
-    for tex in tex_files:
-        all_citations |= helpers.extract_citations_from_tex(tex)
+    if all_keys is None:
+        all_keys = set()
+        for bib in bib_files:
+            for entry in core.parse_bib_file(bib):
+                k = utils.normalize_unicode(entry.get('ID', ''))
+                if k:
+                    all_keys.add(k)
+    if all_citations is None:
+        all_citations = set()
+        for tex in tex_files:
+            all_citations |= helpers.extract_citations_from_tex(tex)
     print("\nFINAL SUMMARY")
     print(f"Files checked: {len(tex_files)} tex, {len(bib_files)} bib")
     print(f"Unique keys: {len(all_keys)}; citations: {len(all_citations)}")
 
 
-def validate_bibliography():
-    """Run the complete validation suite and return whether everything passed."""
-    citation_issues = validate_citations()
-    _ = check_duplicate_keys()
-    doi_count = check_duplicate_dois()
-    title_count = check_duplicate_titles()
-    syntax_ok = check_bibtex_syntax()
+def validate_bibliography(jobs: int = 1):
+    """Run the complete validation suite and return whether everything passed.
+
+    With ``jobs > 1`` the bib files are first parsed by that many worker
+    processes so the checks themselves hit the parse cache, and the pybtex
+    syntax check is spread over the same number of workers.
+    """
+    bibs = helpers.collect_all_bib_files()
+    core.preparse_files(bibs, jobs)
+    # the checks below all read the same unchanged files; each is parsed
+    # (or fetched from the parse cache and copied) once for all of them
+    databases = [core.parse_bibtex_file(bib) for bib in bibs]
+    citation_issues, all_keys, all_citations = _validate_citations(databases)
+    doi_count = _count_duplicate_dois(databases)
+    title_count = _count_duplicate_titles(databases)
+    syntax_ok = check_bibtex_syntax(jobs)
     author_count = check_malformed_author_fields()
     percent_count = check_unescaped_percent()
     correspondence = check_file_correspondence()
-    generate_summary()
+    generate_summary(all_keys, all_citations)
 
     return not (citation_issues or doi_count or title_count or author_count or percent_count or not syntax_ok or not correspondence)
 
 
-def check_bibtex_syntax() -> bool:
+def _syntax_check_version() -> str:
+    """Return the stage-cache version of :func:`check_bibtex_syntax`."""
+    try:
+        from importlib.metadata import version
+        pybtex_version = version('pybtex')
+    except Exception:
+        pybtex_version = 'unknown'
+    return f"{__version__}+pybtex-{pybtex_version}"
+
+
+def _syntax_check_file(bib: Path) -> bytes | None:
+    """Return *bib*'s raw content if both parsers accept it, else ``None``.
+
+    Kept at module level so :func:`check_bibtex_syntax` can run it in worker
+    processes.
+    """
+    try:
+        # read once and hand the same text to both parsers
+        raw = bib.read_bytes()
+        text = raw.decode('utf-8')
+        core.parse_bibtex_string(text)
+        # a missing pybtex has always counted as a syntax error
+        from pybtex.database.input import bibtex  # type: ignore
+        bibtex.Parser().parse_string(text)
+    except Exception:
+        return None
+    return raw
+
+
+def check_bibtex_syntax(jobs: int = 1) -> bool:
+    """Return ``True`` if every bib file parses with bibtexparser and pybtex.
+
+    With ``jobs > 1`` the files that still need checking are parsed by that
+    many worker processes.
+    """
     bibs = helpers.collect_all_bib_files()
+    have_pybtex = importlib.util.find_spec('pybtex') is not None
+    # files that already passed both parsers with their current content are
+    # not parsed again
+    stage_cache = StageCache() if cache_enabled() and have_pybtex else None
+    version = _syntax_check_version()
+    todo = [
+        bib for bib in bibs
+        if stage_cache is None or not stage_cache.matches(bib, 'syntax', version)
+    ]
+    if jobs > 1 and len(todo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            results = list(pool.map(_syntax_check_file, todo))
+    else:
+        results = [_syntax_check_file(bib) for bib in todo]
     errors = False
-    for bib in bibs:
-        try:
-            core.parse_bib_file(bib)
-        except Exception:
-            errors = True
-            continue
-        try:
-            from pybtex.database.input import bibtex  # type: ignore
-            parser = bibtex.Parser()
-            with open(bib, 'r', encoding='utf-8') as f:
-                parser.parse_stream(f)
-        except Exception:
+    for bib, raw in zip(todo, results):
+        if raw is None:
             errors = True
+        elif stage_cache is not None:
+            stage_cache.update(bib, 'syntax', version, content=raw)
+    if stage_cache is not None:
+        stage_cache.save()
     return not errors
 
 
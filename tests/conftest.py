@@ -17,6 +17,18 @@ sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point bibfixer's persistent caches at a per-test directory.
+
+    Without this the stage cache would live in the user's home directory and
+    results from one test (or a previous test run) could leak into another.
+    """
+    cache = tmp_path / "_bibfixer_cache"
+    monkeypatch.setenv("BIBFIXER_CACHE_DIR", str(cache))
+    return cache
+
+
 @pytest.fixture
 def disable_bibfmt(monkeypatch):
     """Patch subprocess.run so that external bibfmt calls are no-ops.
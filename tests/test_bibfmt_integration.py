@@ -75,6 +75,28 @@ def test_format_with_bibfmt_warns_on_meta_change(tmp_path, monkeypatch, capsys):
     assert "Warning: bibfmt changed DOI" in out
 
 
+def test_format_with_bibfmt_checks_files_when_batch_fails(tmp_path, monkeypatch, capsys):
+    # bibfmt rewrites the first file, then fails on the second
+    good = tmp_path / "good.bib"
+    good.write_text("@article{g,\n  title={Old Title},\n  doi={10.1000/old},\n}\n")
+    bad = tmp_path / "bad.bib"
+    bad.write_text("@article{b,\n  title={Broken\n")
+
+    def fake_run(cmd, capture_output, text, timeout):
+        good.write_text("@article{g,\n  title={Old Title},\n  doi={10.1000/new},\n}\n")
+        class Result:
+            returncode = 1
+            stdout = ""
+            stderr = "bad.bib: parse error"
+        return Result()
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    format_with_bibfmt([good, bad])
+    out = capsys.readouterr().out
+    assert "bibfmt had issues: bad.bib: parse error" in out
+    assert "Warning: bibfmt changed DOI" in out
+
+
 def test_format_with_bibfmt_no_meta_warning(tmp_path, monkeypatch, capsys):
     # bibfmt rewrites spacing but leaves title/doi unchanged; no warnings
     bib_path = tmp_path / "sample.bib"
@@ -101,3 +123,61 @@ def test_format_with_bibfmt_no_meta_warning(tmp_path, monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "altered title" not in out
     assert "changed DOI" not in out
+
+
+def test_curate_formats_all_files_with_one_bibfmt_call(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, capture_output, text, timeout):
+        calls.append(cmd)
+        class Result:
+            returncode = 0
+            stderr = ""
+        return Result()
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setenv("BIBFIXER_NO_BETTERBIB", "1")
+    monkeypatch.chdir(tmp_path)
+    bibs = []
+    for name in ("a", "b"):
+        bib = tmp_path / f"{name}.bib"
+        bib.write_text(f"@article{{{name},\n  title={{T {name}}},\n}}\n")
+        bibs.append(bib)
+
+    from bibfixer.cli import curate_bibliography
+
+    curate_bibliography(bibs, create_backups=False, preserve_keys=True)
+    bibfmt_calls = [c for c in calls if 'bibfmt' in c[0]]
+    # one batch before the cross-file steps and one final pass
+    assert len(bibfmt_calls) == 2
+    assert all(c[-2:] == [str(b) for b in bibs] for c in bibfmt_calls)
+
+
+def test_curate_rerun_skips_bibfmt_on_formatted_files(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, capture_output, text, timeout):
+        calls.append(cmd)
+        class Result:
+            returncode = 0
+            stderr = ""
+        return Result()
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setenv("BIBFIXER_NO_BETTERBIB", "1")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "main.tex").write_text(r"\cite{a}")
+    bib = tmp_path / "refs.bib"
+    bib.write_text("@article{a,\n  title={T},\n}\n")
+
+    from bibfixer.cli import curate_bibliography
+
+    curate_bibliography([bib], create_backups=False, preserve_keys=True)
+    assert any('bibfmt' in c[0] for c in calls)
+    calls.clear()
+    # nothing changed since bibfmt last saw the file
+    curate_bibliography([bib], create_backups=False, preserve_keys=True)
+    assert not any('bibfmt' in c[0] for c in calls)
+    bib.write_text(bib.read_text() + "@article{b,\n  title={U},\n}\n")
+    curate_bibliography([bib], create_backups=False, preserve_keys=True)
+    assert any('bibfmt' in c[0] for c in calls)
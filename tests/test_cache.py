@@ -0,0 +1,72 @@
+from bibfixer.cache import StageCache, cache_dir, file_digest
+
+
+def test_cache_dir_honours_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("BIBFIXER_CACHE_DIR", str(tmp_path / "c"))
+    assert cache_dir() == tmp_path / "c"
+
+
+def test_stage_cache_matches_until_content_changes(tmp_path):
+    bib = tmp_path / "refs.bib"
+    bib.write_text("@article{A,\n  title={T},\n}\n")
+    cache = StageCache(tmp_path / "stages.json")
+    assert not cache.matches(bib, "fix_html_entities", "1")
+
+    cache.update(bib, "fix_html_entities", "1")
+    assert cache.matches(bib, "fix_html_entities", "1")
+    # a different stage or version is never considered done
+    assert not cache.matches(bib, "fix_unescaped_percent", "1")
+    assert not cache.matches(bib, "fix_html_entities", "2")
+
+    # same size but different content must not be mistaken for a hit
+    bib.write_text("@article{B,\n  title={T},\n}\n")
+    assert not cache.matches(bib, "fix_html_entities", "1")
+
+
+def test_stage_cache_round_trips_through_disk(tmp_path):
+    bib = tmp_path / "refs.bib"
+    bib.write_text("@article{A,\n  title={T},\n}\n")
+    path = tmp_path / "sub" / "stages.json"
+    cache = StageCache(path)
+    cache.update(bib, "fix_legacy_year_fields", "1")
+    cache.save()
+    assert path.exists()
+    assert not list(path.parent.glob("*.tmp"))
+
+    reloaded = StageCache(path)
+    assert reloaded.matches(bib, "fix_legacy_year_fields", "1")
+    assert file_digest(tmp_path / "missing.bib") is None
+
+    # a corrupt cache file is treated as empty rather than raising
+    path.write_text("{not json")
+    assert not StageCache(path).matches(bib, "fix_legacy_year_fields", "1")
+
+
+def test_stage_cache_failed_save_leaves_no_temporary_file(tmp_path, monkeypatch):
+    import json
+
+    bib = tmp_path / "refs.bib"
+    bib.write_text("@article{A,\n  title={T},\n}\n")
+    path = tmp_path / "stages.json"
+    cache = StageCache(path)
+    cache.update(bib, "fix_legacy_year_fields", "1")
+
+    def full_disk(*args, **kwargs):
+        raise OSError("no space left on device")
+
+    monkeypatch.setattr(json, "dump", full_disk)
+    cache.save()
+    assert not path.exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_stage_cache_records_pending_content(tmp_path):
+    # a stage whose output has not been flushed yet records it explicitly
+    bib = tmp_path / "refs.bib"
+    bib.write_text("@article{A,\n  title={Old},\n}\n")
+    new = "@article{A,\n  title={New},\n}\n"
+    cache = StageCache(tmp_path / "stages.json")
+    cache.update(bib, "basic_fixes", "1", content=new.encode("utf-8"))
+    assert not cache.matches(bib, "basic_fixes", "1")
+    bib.write_text(new)
+    assert cache.matches(bib, "basic_fixes", "1")
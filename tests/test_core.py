@@ -96,3 +96,201 @@ def test_field_transform_propagates_exceptions(tmp_path):
     else:
         # if no exception was raised, that's a problem
         assert False, "field_transform should propagate exceptions"
+
+
+def test_parsed_field_names_are_lowercase(tmp_path):
+    # fixers look up ``entry.get('doi')`` only, relying on the parser to
+    # fold ``DOI``/``Doi`` spellings for them
+    path = tmp_path / "case.bib"
+    path.write_text("@article{c,\n  DOI={10.1/X},\n  Title={T},\n}\n")
+    entry = BibFile(path).entries[0]
+    assert entry["doi"] == "10.1/X"
+    assert entry["title"] == "T"
+    assert "DOI" not in entry
+
+
+def test_parse_cache_returns_independent_copies(tmp_path):
+    from bibfixer.core import parse_bibtex_file
+
+    path = tmp_path / "cache.bib"
+    path.write_text("@article{a,\n  title={One},\n}\n")
+    first = parse_bibtex_file(path)
+    first.entries[0]["title"] = "mutated"
+    second = parse_bibtex_file(path)
+    assert second.entries[0]["title"] == "One"
+
+    # a same-size rewrite must still be picked up
+    path.write_text("@article{a,\n  title={Two},\n}\n")
+    assert parse_bibtex_file(path).entries[0]["title"] == "Two"
+
+
+def test_bib_pipeline_defers_write_until_flush(tmp_path):
+    from bibfixer.core import BibPipeline
+
+    path = tmp_path / "pipe.bib"
+    original = "@article{p,\n  title={Old},\n}\n"
+    path.write_text(original)
+    pipeline = BibPipeline(path)
+
+    def retitle(db):
+        db.entries[0]["title"] = "New"
+        return 1
+
+    assert pipeline.apply_text_fixer(lambda text: (text, 0)) == 0
+    assert pipeline.apply_entry_fixer(retitle, precheck=lambda text: False) == 0
+    assert pipeline.apply_entry_fixer(retitle) == 1
+    assert "New" in pipeline.text
+    assert path.read_text() == original
+    assert pipeline.flush()
+    assert "New" in path.read_text()
+    assert not pipeline.flush()
+
+
+def test_scan_bib_ids_dois_skips_comments_and_strings(tmp_path):
+    from bibfixer.core import scan_bib_ids_dois, scan_duplicate_candidates
+
+    path = tmp_path / "scan.bib"
+    path.write_text(
+        '@string{j = "J"}\n'
+        "@Article{Smith2020,\n  DOI = {{10.1/ABC}},\n  year = 2020,\n  month = jan\n}\n"
+        "@comment{@article{Gone2019,\n  doi = {10.9/x}\n}}\n"
+        '@book( Doe2021 ,\n  doi="https://doi.org/10.1/abc",\n)\n'
+    )
+    assert scan_bib_ids_dois(path) == [
+        ("Smith2020", "10.1/ABC", "2020", "jan"),
+        ("Doe2021", "https://doi.org/10.1/abc", None, None),
+    ]
+    assert scan_duplicate_candidates([path]) == (False, True)
+
+
+def test_scan_duplicate_candidates_never_hides_parsed_duplicates(tmp_path, monkeypatch):
+    from bibfixer import validation
+    from bibfixer.core import scan_duplicate_candidates
+
+    monkeypatch.chdir(tmp_path)
+    # an escaped DOI, and a DOI mentioned in another field before the real
+    # one; the parser sees two duplicated DOIs although the raw text differs
+    (tmp_path / "references.bib").write_text(
+        "@article{A,\n  doi={10.1000/a{\\_}b},\n}\n"
+        "@article{C,\n  url={https://example.org/?doi=10.7/zzz},\n  doi={10.7/e},\n}\n"
+        "@article{B,\n  doi={10.1000/a_b},\n}\n"
+        "@article{D,\n  doi={10.7/e},\n}\n"
+    )
+    assert scan_duplicate_candidates([tmp_path / "references.bib"]) == (False, True)
+    assert validation.check_duplicate_dois() == 2
+
+    macro = tmp_path / "macro.bib"
+    macro.write_text('@string{d = "10.1/x"}\n@misc{E,\n  doi = d,\n}\n@misc{F,\n  doi = {10.1/x},\n}\n')
+    assert scan_duplicate_candidates([macro])[1]
+    key = tmp_path / "key.bib"
+    key.write_text('@misc{G{\\"o},\n  title={T},\n}\n')
+    assert scan_duplicate_candidates([key])[0]
+
+
+def test_parse_results_persist_across_runs(tmp_path, monkeypatch):
+    import bibtexparser
+    import pytest
+    from bibfixer.core import clear_parse_cache, parse_bibtex_file
+
+    clear_parse_cache()
+    path = tmp_path / "persist.bib"
+    path.write_text("@article{a,\n  title={One},\n}\n")
+    assert parse_bibtex_file(path).entries[0]["title"] == "One"
+
+    # a fresh process only has the on-disk copy to go on
+    clear_parse_cache()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed again")
+
+    monkeypatch.setattr(bibtexparser, "loads", fail)
+    assert parse_bibtex_file(path).entries[0]["title"] == "One"
+
+    monkeypatch.setenv("BIBFIXER_NO_CACHE", "1")
+    clear_parse_cache()
+    with pytest.raises(RuntimeError):
+        parse_bibtex_file(path)
+
+
+def test_parse_cache_on_disk_is_plain_json(tmp_path, monkeypatch):
+    import json
+    import pickle
+    from bibfixer import core
+    from bibfixer.cache import cache_dir
+
+    core.clear_parse_cache()
+    parsed_dir = cache_dir() / "parsed"
+    parsed_dir.mkdir(parents=True, exist_ok=True)
+    stale = parsed_dir / "old.pickle"
+    stale.write_bytes(pickle.dumps({"old": "format"}))
+    path = tmp_path / "plain.bib"
+    path.write_text('@string{j = "J"}\n@article{a,\n  title={One},\n  journal=j,\n}\n')
+    core.parse_bibtex_file(path)
+
+    stored = list(parsed_dir.glob("*.json"))
+    assert len(stored) == 1
+    assert json.loads(stored[0].read_text())["entries"][0]["journal"] == "J"
+    # pruning runs on every store and drops the old pickle format
+    assert not stale.exists()
+    assert not list(parsed_dir.glob("*.tmp"))
+
+    # a file that does not hold the expected data is ignored and re-parsed
+    stored[0].write_text(json.dumps({"entries": [{"ID": 1}]}))
+    core.clear_parse_cache()
+    assert core.parse_bibtex_file(path).entries[0]["title"] == "One"
+
+
+def test_parse_cache_on_disk_only_holds_bounded_file_parses(tmp_path, monkeypatch):
+    from bibfixer import core
+    from bibfixer.cache import cache_dir
+
+    core.clear_parse_cache()
+    parsed_dir = cache_dir() / "parsed"
+    # text parsed from memory, such as bibfmt before/after checks, stays there
+    core.parse_bibtex_string("@article{a,\n  title={In memory},\n}\n")
+    assert not list(parsed_dir.glob("*.json"))
+
+    monkeypatch.setattr(core, "_PARSE_CACHE_MAX_FILES", 2)
+    for i in range(4):
+        path = tmp_path / f"bounded{i}.bib"
+        path.write_text(f"@article{{k{i},\n  title={{Title {i}}},\n}}\n")
+        core.parse_bibtex_file(path)
+        assert len(list(parsed_dir.glob("*.json"))) <= 2
+
+
+def test_preparse_files_seeds_parse_cache(tmp_path, monkeypatch):
+    import bibtexparser
+    from bibfixer.core import clear_parse_cache, parse_bibtex_file, preparse_files
+
+    monkeypatch.setenv("BIBFIXER_NO_CACHE", "1")
+    clear_parse_cache()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"pre{i}.bib"
+        path.write_text(f"@article{{k{i},\n  title={{Title {i}}},\n}}\n")
+        paths.append(path)
+    broken = tmp_path / "broken.bib"
+    broken.write_bytes(b"\xff\xfe")
+    preparse_files(paths + [broken], jobs=2)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed again")
+
+    monkeypatch.setattr(bibtexparser, "loads", fail)
+    assert [parse_bibtex_file(p).entries[0]["ID"] for p in paths] == ["k0", "k1", "k2"]
+
+
+def test_atomic_write_text_keeps_symlink_and_mode(tmp_path):
+    from bibfixer.core import atomic_write_text
+
+    real = tmp_path / "real.bib"
+    real.write_text("old")
+    real.chmod(0o640)
+    link = tmp_path / "link.bib"
+    link.symlink_to(real)
+
+    atomic_write_text(link, "new")
+    assert link.is_symlink()
+    assert real.read_text() == "new"
+    assert real.stat().st_mode & 0o777 == 0o640
+    assert not list(tmp_path.glob("*.tmp"))
@@ -307,6 +307,30 @@ def test_betterbib_skip_malformed_file(tmp_path, capsys):
     assert bib.read_text().startswith("@article")
 
 
+def test_betterbib_skipped_without_work(tmp_path, monkeypatch, capsys):
+    # no entries means nothing to update; no journals nothing to abbreviate
+    calls = []
+
+    def fake_run(cmd, capture_output, text, timeout):
+        calls.append(cmd)
+        raise AssertionError("betterbib should not be started")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    from bibfixer.curate import abbreviate_with_betterbib, update_with_betterbib
+
+    empty = tmp_path / "empty.bib"
+    empty.write_text("% nothing here yet\n")
+    update_with_betterbib(empty)
+    nojournal = tmp_path / "book.bib"
+    nojournal.write_text("@book{B, title={T}, publisher={P}}\n")
+    abbreviate_with_betterbib(nojournal)
+
+    out = capsys.readouterr().out
+    assert "No entries to update" in out
+    assert "No journal names to abbreviate" in out
+    assert calls == []
+
+
 def test_abbreviate_journal_names_heuristic(tmp_path, disable_bibfmt, monkeypatch):
     tex = setup_simple_project(tmp_path)
     bib = tmp_path / "refs.bib"
@@ -381,6 +405,24 @@ def test_heuristic_skip_already_abbreviated(monkeypatch):
     assert _heuristic_abbrev("J. Test.") == "J. Test."
 
 
+def test_journal_abbreviation_asks_iso4_once_per_name(monkeypatch):
+    from bibtexparser.bibdatabase import BibDatabase
+    from bibfixer.fixes import _abbreviate_journals
+    import iso4
+    calls = []
+
+    def fake(j):
+        calls.append(j)
+        return "Sm. J."
+
+    monkeypatch.setattr(iso4, "abbreviate", fake)
+    db = BibDatabase()
+    db.entries = [{"ID": k, "journal": "Some Journal"} for k in ("A", "B", "C")]
+    assert _abbreviate_journals(db) == 3
+    assert calls == ["Some Journal"]
+    assert all(e["journal"] == "Sm. J." for e in db.entries)
+
+
 
 def test_betterbib_abbrev_even_if_update_crashes(tmp_path, monkeypatch, capsys):
     # update step fails but abbreviation still executes
@@ -448,3 +490,87 @@ def test_duplicate_title_consolidation(tmp_path, disable_bibfmt):
     newtex = tex.read_text()
     assert newkey in newtex
     assert newtex.count(newkey) == 1
+
+
+def test_create_backup_is_independent_copy(tmp_path):
+    from bibfixer.curate import create_backup
+
+    bib = tmp_path / "refs.bib"
+    bib.write_text("@article{A,\n  title={Original},\n}\n")
+    backup = create_backup(bib)
+    assert backup.read_text() == bib.read_text()
+    # rewriting the original in place must not leak into the backup
+    with open(bib, "r+") as f:
+        f.write("@article{B")
+    assert "Original" in backup.read_text()
+    assert "@article{A" in backup.read_text()
+
+
+def test_consolidate_duplicate_dois_rewrites_files(tmp_path):
+    from bibfixer.curate import consolidate_duplicate_dois, find_duplicate_dois
+
+    a = tmp_path / "a.bib"
+    b = tmp_path / "b.bib"
+    a.write_text("""@article{smith_x,
+  title={Shared},
+  doi={10.1/abc},
+}
+
+@article{Other2020,
+  title={Unrelated},
+}
+""")
+    b.write_text("""@article{Smith2020,
+  title={Shared},
+  author={Smith},
+  year={2020},
+  doi={https://doi.org/10.1/ABC},
+}
+""")
+    dups = find_duplicate_dois([a, b])
+    mapping = consolidate_duplicate_dois([a, b], dups)
+    assert mapping == {"smith_x": "Smith2020"}
+    text_a = a.read_text()
+    assert "smith_x" not in text_a
+    assert "Other2020" in text_a
+    assert "Smith2020" in b.read_text()
+
+
+def test_curate_parallel_jobs(tmp_path, disable_bibfmt, capsys):
+    tex = setup_simple_project(tmp_path)
+    tex.write_text(r"\cite{A} \cite{B}")
+    first = tmp_path / "a.bib"
+    second = tmp_path / "b.bib"
+    first.write_text("@article{A,\n  title={First},\n  month={jan},\n}\n")
+    second.write_text("@article{B,\n  title={Second},\n  month={feb},\n}\n")
+
+    curate_bibliography([first, second], create_backups=False, use_betterbib=False, jobs=2)
+
+    assert re.search(r"month\s*=\s*\{1\}", first.read_text())
+    assert re.search(r"month\s*=\s*\{2\}", second.read_text())
+    out = capsys.readouterr().out
+    # worker output is replayed in file order
+    assert out.index("Processing a.bib") < out.index("Processing b.bib")
+
+
+def test_snapshot_backup_skips_ficlone_on_unknown_ioctl_encoding(tmp_path, monkeypatch):
+    import fcntl
+    import platform
+    import sys
+
+    from bibfixer import curate
+
+    def fail(*args):
+        raise AssertionError("ioctl tried with a guessed request number")
+
+    monkeypatch.delattr(fcntl, "FICLONE", raising=False)
+    monkeypatch.setattr(fcntl, "ioctl", fail)
+    monkeypatch.setattr(platform, "machine", lambda: "ppc64le")
+    src = tmp_path / "refs.bib"
+    src.write_text("@article{A,\n  title={T},\n}\n")
+    backup = curate.create_backup(src)
+    assert backup.read_text() == src.read_text()
+
+    monkeypatch.setattr(platform, "machine", lambda: "x86_64")
+    if sys.platform.startswith("linux"):
+        assert curate._ficlone_request(fcntl) == 0x40049409
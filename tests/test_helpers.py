@@ -71,6 +71,13 @@ def test_update_tex_deduplicates(tmp_path):
     assert content.strip().endswith("cite{K, Z}.")
 
 
+def test_update_tex_leaves_command_name_alone(tmp_path):
+    tex = tmp_path / "foo.tex"
+    tex.write_text(r"See \cite{cite}.")
+    helpers.update_tex_citations([tex], {"cite": "Smith2020"})
+    assert tex.read_text() == r"See \cite{Smith2020}."
+
+
 def test_sanitize_citation_keys(tmp_path):
     bib = tmp_path / "test.bib"
     bib.write_text("""@article{Bad!Key,
@@ -119,6 +126,30 @@ def test_generate_and_standardize_keys(tmp_path):
     assert len(keys) == 2
 
 
+def test_standardize_keys_numbers_repeated_collisions(tmp_path):
+    bib = tmp_path / "many.bib"
+    entry = "@article{{k{0},\n  author={{Smith, John}},\n  year={{2021}},\n  title={{Same}},\n}}\n"
+    bib.write_text("".join(entry.format(i) for i in range(4)))
+    mapping = helpers.standardize_citation_keys(bib)
+    assert [mapping[f"k{i}"] for i in range(4)] == [
+        "Smith2021Same", "Smith2021Same1", "Smith2021Same2", "Smith2021Same3"]
+
+
+def test_fix_citation_keys_chains_mappings(tmp_path):
+    bib = tmp_path / "chain.bib"
+    bib.write_text("""@article{Bad!Key,
+  author={Smith, John},
+  year={2021},
+  journal={Nature},
+  title={Example},
+}
+""")
+    mapping = helpers.fix_citation_keys(bib)
+    # the original key maps straight to the standardized one
+    assert mapping["Bad!Key"] == "Smith2021NExample"
+    assert "@article{Smith2021NExample," in bib.read_text()
+
+
 def test_generate_citation_key_various():
     # test _generate_citation_key output directly
     entry = {
@@ -4,6 +4,7 @@ from bibfixer.utils import (
     normalize_url,
     normalize_keywords,
     normalize_title,
+    titles_similar,
 )
 
 
@@ -23,6 +24,8 @@ def test_normalize_doi_with_prefixes():
     assert normalize_doi("DOI:10.1000/xyz") == "10.1000/xyz"
     assert normalize_doi("https://doi.org/10.1000/xyz") == "10.1000/xyz"
     assert normalize_doi("http://dx.doi.org/10.1000/xyz") == "10.1000/xyz"
+    assert normalize_doi("https://dx.doi.org/10.1000/xyz") == "10.1000/xyz"
+    assert normalize_doi("HTTP://DOI.ORG/10.1000/XYZ") == "10.1000/xyz"
 
 
 def test_normalize_doi_strip_whitespace_and_case():
@@ -59,3 +62,17 @@ def test_normalize_title_function():
     assert norm == "a title with hyphens and spaces"
     # different punctuation treated similarly
     assert normalize_title("A – Title") == "a title"
+
+
+def test_titles_similar_ignores_formatting_but_not_rewrites():
+    assert titles_similar("{Deep} Learning for  Chemistry", "deep learning for chemistry")
+    assert titles_similar("Chemistry for Deep Learning", "Deep Learning for Chemistry")
+    # a single-letter typo fix is not a meaningful change
+    assert titles_similar("Machine learning in catalysis", "Machine learning in catalyisis")
+    assert not titles_similar("Old Title", "New Title Completely Different")
+
+
+def test_titles_similar_token_set_subset():
+    # a title that only gains a subtitle is the same work
+    assert titles_similar("Deep learning", "Deep learning: a review of methods")
+    assert not titles_similar("", "Something")
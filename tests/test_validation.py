@@ -31,6 +31,18 @@ def test_check_unescaped_percent(tmp_path, monkeypatch):
     assert validation.check_unescaped_percent() == 0
 
 
+def test_check_unescaped_percent_counts_lines_and_skips_comments(tmp_path, monkeypatch):
+    bib = tmp_path / "p.bib"
+    bib.write_text("""% 50% of this header is a comment
+@article{X,
+  title={100% and 20% sure},
+  note={\\\\% double escape},
+}
+""")
+    monkeypatch.chdir(tmp_path)
+    assert validation.check_unescaped_percent() == 2
+
+
 def test_duplicate_key_and_doi(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     b1 = tmp_path / "one.bib"
@@ -90,3 +102,80 @@ def test_validate_citations_prints_details(tmp_path, monkeypatch, capsys):
     assert "Summary: 2/3 citations valid" in out
     assert "Missing citation keys" in out
     assert "C" in out
+
+
+def test_validate_citations_reports_commented_entries(tmp_path, monkeypatch, capsys):
+    tex = tmp_path / "main.tex"
+    tex.write_text(r"See \cite{A,Gone}.")
+    bib = tmp_path / "main.bib"
+    bib.write_text("""@article{A,title={T}}
+@comment{@article{Gone,
+  title={Hidden},
+}}
+""")
+    monkeypatch.chdir(tmp_path)
+    issues = validation.validate_citations()
+    assert "main.tex: commented Gone" in issues
+    assert "Commented-out citation keys (1): Gone" in capsys.readouterr().out
+
+
+def test_check_bibtex_syntax_skips_files_already_checked(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bib = tmp_path / "s.bib"
+    bib.write_text("@article{S,\n  title={T},\n}\n")
+    assert validation.check_bibtex_syntax()
+
+    def fail(text):
+        raise AssertionError("unchanged file was parsed again")
+
+    monkeypatch.setattr(validation.core, "parse_bibtex_string", fail)
+    assert validation.check_bibtex_syntax()
+    # any change to the content means it has to be checked again
+    bib.write_text("@article{S,\n  title={T2},\n}\n")
+    assert not validation.check_bibtex_syntax()
+
+
+def test_check_bibtex_syntax_in_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.bib").write_text(f"@article{{{name},\n  title={{T}},\n}}\n")
+    assert validation.check_bibtex_syntax(jobs=2)
+    (tmp_path / "c.bib").write_bytes(b"@article{c,\n  title={\xff},\n}\n")
+    assert not validation.check_bibtex_syntax(jobs=2)
+
+
+def test_generate_summary_uses_collected_sets(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "main.tex").write_text(r"\cite{A}")
+    (tmp_path / "main.bib").write_text("@article{A,\n  title={T},\n}\n")
+
+    def fail(path):
+        raise AssertionError("files were read again")
+
+    monkeypatch.setattr(validation.core, "parse_bib_file", fail)
+    monkeypatch.setattr(validation.helpers, "extract_citations_from_tex", fail)
+    validation.generate_summary({"A", "B"}, {"A"})
+    assert "Unique keys: 2; citations: 1" in capsys.readouterr().out
+
+
+def test_validate_bibliography_parses_each_file_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "main.tex").write_text(r"\cite{A}")
+    # two DOIs in one file make the duplicate scan unable to rule out a parse
+    (tmp_path / "main.bib").write_text(
+        "@article{A,\n  title={T},\n  doi={10.1/x},\n}\n"
+        "@article{B,\n  title={U},\n  doi={10.1/x},\n}\n"
+    )
+    parsed = []
+    real = validation.core._parse_bytes
+
+    def counting(raw):
+        parsed.append(raw)
+        return real(raw)
+
+    # every file read of the parse cache goes through here; the syntax check
+    # parses independently on purpose and is left out
+    monkeypatch.setattr(validation.core, "_parse_bytes", counting)
+    monkeypatch.setattr(validation, "check_bibtex_syntax", lambda jobs=1: True)
+    assert not validation.validate_bibliography()
+    assert len(parsed) == 1